@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from usp.http_client import get_http_client, get_useragent, read_response_data
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import httpx
+    from pytest_httpx import HTTPXMock
+
+TEST_URL = "http://test_ultimate-sitemap-parser.com/sitemap.xml"
+
+
+@pytest.fixture(scope="module")
+def http_client() -> Iterator[httpx.Client]:
+    """HTTP client shared by all tests in the module, so that it gets set up only once."""
+    with get_http_client() as client:
+        yield client
+
+
+def test_read_response_data(httpx_mock: HTTPXMock, http_client: httpx.Client) -> None:
+    """Test read_response_data() function."""
+    httpx_mock.add_response(url=TEST_URL, content=b"x" * 1024 * 1024)
+
+    with http_client.stream("GET", TEST_URL) as response:
+        assert read_response_data(response=response, max_length=512 * 1024) == b"x" * 512 * 1024
+
+    with http_client.stream("GET", TEST_URL) as response:
+        assert read_response_data(response=response, max_length=2 * 1024 * 1024) == b"x" * 1024 * 1024
+
+    with http_client.stream("GET", TEST_URL) as response:
+        assert read_response_data(response=response, max_length=1000, chunk_size=300) == b"x" * 1000
+
+
+def test_get_http_client(httpx_mock: HTTPXMock, http_client: httpx.Client) -> None:
+    """Test that get_http_client() sends a User-Agent."""
+    httpx_mock.add_response(url=TEST_URL, text="foo")
+
+    response: httpx.Response = http_client.get(TEST_URL)
+    assert response.text == "foo"
+    assert httpx_mock.get_request().headers["User-Agent"] == get_useragent()
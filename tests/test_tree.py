@@ -1,6 +1,32 @@
 from __future__ import annotations
 
 import gzip as gzip_lib
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+from usp.objects.page import SITEMAP_PAGE_DEFAULT_PRIORITY, SitemapPageChangeFrequency
+from usp.objects.sitemap import (
+    IndexRobotsTxtSitemap,
+    IndexWebsiteSitemap,
+    IndexXMLSitemap,
+    InvalidSitemap,
+    PagesAtomSitemap,
+    PagesRSSSitemap,
+    PagesXMLSitemap,
+)
+from usp.tree import sitemap_tree_for_homepage
+
+if TYPE_CHECKING:
+    import pytest
+    from pytest_httpx import HTTPXMock
+
+    from usp.objects.sitemap import AbstractSitemap
+
+# Base URL of the mocked website; requests never leave the process.
+TEST_BASE_URL = "http://test_ultimate-sitemap-parser.com"
 
 # TODO: various exotic properties
 # TODO: XML vulnerabilities with Expat
@@ -8,30 +34,487 @@ import gzip as gzip_lib
 # TODO: tests responses that are too big
 
 
-def gzip(data: str | bytes) -> bytes:
-    """Gzip data."""
-    if data is None:
-        msg = "Data is None."
-        raise Exception(msg)  # noqa: TRY002 # sourcery skip: raise-specific-error
-
+def gzip(data: str | bytes, /) -> bytes:
+    """Gzip data, encoding strings as UTF-8 first."""
     if isinstance(data, str):
         data = data.encode("utf-8")
 
-    if not isinstance(data, bytes):
-        msg = "Data is not bytes."
-        raise TypeError(msg)
+    return gzip_lib.compress(data, compresslevel=9)
+
+
+def test_sitemap_tree_for_homepage_gzip(httpx_mock: HTTPXMock) -> None:
+    """Test sitemap_tree_for_homepage() with a gzipped sitemap listed in robots.txt."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nDisallow: /whatever\n\nSITEMAP: {TEST_BASE_URL}/Sitemap_Pages.xml.gz\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/Sitemap_Pages.xml.gz",
+        content=gzip(
+            f"""<?xml version="1.0" encoding="UTF-8"?>
+            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <url>
+                    <loc>{TEST_BASE_URL}/about.html</loc>
+                    <lastmod>2009-12-17</lastmod>
+                    <changefreq>monthly</changefreq>
+                    <priority>0.8</priority>
+                </url>
+                <url>
+                    <loc>{TEST_BASE_URL}/contact.html</loc>
+                    <changefreq>WEEKLY</changefreq>
+                    <priority>1.5</priority>
+                </url>
+            </urlset>
+            """,
+        ),
+        headers={"Content-Type": "application/x-gzip"},
+    )
+
+    # Every other unpublished sitemap path is missing
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    assert isinstance(actual_sitemap_tree, IndexWebsiteSitemap)
+    assert not hasattr(actual_sitemap_tree, "__dict__")
+    assert actual_sitemap_tree.url == f"{TEST_BASE_URL}/"
+
+    robots_txt_sitemap = actual_sitemap_tree.sub_sitemaps[0]
+    assert isinstance(robots_txt_sitemap, IndexRobotsTxtSitemap)
+    assert len(actual_sitemap_tree.sub_sitemaps) == 1
+
+    pages_sitemap = robots_txt_sitemap.sub_sitemaps[0]
+    assert isinstance(pages_sitemap, PagesXMLSitemap)
+    assert pages_sitemap.url == f"{TEST_BASE_URL}/Sitemap_Pages.xml.gz"
+
+    pages = list(actual_sitemap_tree.all_pages())
+    assert [page.url for page in pages] == [f"{TEST_BASE_URL}/about.html", f"{TEST_BASE_URL}/contact.html"]
+    assert not hasattr(pages[0], "__dict__")
+    assert str(pages[0].priority) == "0.8"
+    assert pages[0].change_frequency == SitemapPageChangeFrequency.MONTHLY
+    assert pages[1].priority == SITEMAP_PAGE_DEFAULT_PRIORITY
+    assert pages[1].change_frequency == SitemapPageChangeFrequency.WEEKLY
+
+
+def test_sitemap_tree_for_homepage_index(httpx_mock: HTTPXMock) -> None:
+    """Test sitemap_tree_for_homepage() with an index sitemap, of which sub-sitemaps are fetched concurrently.
+
+    Duplicate sub-sitemap and page URLs are only kept once.
+    """
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_index.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_index.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <sitemap><loc>{TEST_BASE_URL}/sitemap_1.xml</loc></sitemap>
+                <sitemap><loc>{TEST_BASE_URL}/sitemap_2.xml</loc></sitemap>
+                <sitemap><loc>{TEST_BASE_URL}/sitemap_3.xml</loc></sitemap>
+                <sitemap><loc>{TEST_BASE_URL}/sitemap_missing.xml</loc></sitemap>
+                <sitemap><loc>{TEST_BASE_URL}/sitemap_1.xml</loc></sitemap>
+            </sitemapindex>
+            """,
+    )
+    for number in range(1, 4):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/sitemap_{number}.xml",
+            text=f"""<?xml version="1.0" encoding="UTF-8"?>
+                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                    <url><loc>{TEST_BASE_URL}/page_{number}.html</loc></url>
+                    <url><loc>{TEST_BASE_URL}/page_{number}.html</loc></url>
+                </urlset>
+                """,
+        )
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    assert isinstance(actual_sitemap_tree, IndexWebsiteSitemap)
+    assert len(actual_sitemap_tree.sub_sitemaps) == 1
+
+    index_sitemap = actual_sitemap_tree.sub_sitemaps[0].sub_sitemaps[0]
+    assert isinstance(index_sitemap, IndexXMLSitemap)
+    assert [sub_sitemap.url for sub_sitemap in index_sitemap.sub_sitemaps] == [
+        f"{TEST_BASE_URL}/sitemap_1.xml",
+        f"{TEST_BASE_URL}/sitemap_2.xml",
+        f"{TEST_BASE_URL}/sitemap_3.xml",
+        f"{TEST_BASE_URL}/sitemap_missing.xml",
+    ]
+    assert isinstance(index_sitemap.sub_sitemaps[3], InvalidSitemap)
+
+    assert [page.url for page in actual_sitemap_tree.all_pages()] == [
+        f"{TEST_BASE_URL}/page_1.html",
+        f"{TEST_BASE_URL}/page_2.html",
+        f"{TEST_BASE_URL}/page_3.html",
+    ]
+
+
+def test_sitemap_tree_for_homepage_nested_index(httpx_mock: HTTPXMock) -> None:
+    """Test that index sitemaps of index sitemaps don't multiply the number of threads fetching sub-sitemaps.
+
+    Requests to the single host are limited to a few at a time, however many threads there are.
+    """
+    index_count = page_sitemap_count = 10
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text="User-agent: *\n" + "".join(f"Sitemap: {TEST_BASE_URL}/index_{i}.xml\n" for i in range(index_count)),
+    )
+    for i in range(index_count):
+        sub_sitemaps = "".join(
+            f"<sitemap><loc>{TEST_BASE_URL}/pages_{i}_{j}.xml</loc></sitemap>" for j in range(page_sitemap_count)
+        )
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/index_{i}.xml",
+            text=f"""<?xml version="1.0" encoding="UTF-8"?>
+                <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{sub_sitemaps}</sitemapindex>
+                """,
+        )
+
+    thread_counts: list[int] = []
+    in_flight_counts: list[int] = [0]
+    in_flight_lock = threading.Lock()
+
+    def pages_sitemap(request: httpx.Request) -> httpx.Response:
+        thread_counts.append(threading.active_count())
+        with in_flight_lock:
+            in_flight_counts.append(in_flight_counts[-1] + 1)
+        time.sleep(0.01)
+        with in_flight_lock:
+            in_flight_counts.append(in_flight_counts[-1] - 1)
+        return httpx.Response(
+            status_code=200,
+            text=f"""<?xml version="1.0" encoding="UTF-8"?>
+                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                    <url><loc>{TEST_BASE_URL}{request.url.path.removesuffix(".xml")}.html</loc></url>
+                </urlset>
+                """,
+        )
+
+    for i in range(index_count):
+        for j in range(page_sitemap_count):
+            httpx_mock.add_callback(pages_sitemap, url=f"{TEST_BASE_URL}/pages_{i}_{j}.xml")
+    httpx_mock.add_response(status_code=404)
+
+    thread_count_before: int = threading.active_count()
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    assert len(list(actual_sitemap_tree.all_pages())) == index_count * page_sitemap_count
+
+    # Threads are shared by the whole crawl instead of every index sitemap starting its own set of them
+    assert len(thread_counts) == index_count * page_sitemap_count
+    assert max(thread_counts) - thread_count_before <= 32  # noqa: PLR2004
+    assert max(in_flight_counts) <= 4  # noqa: PLR2004
+
+
+def test_sitemap_tree_for_homepage_web_client(httpx_mock: HTTPXMock) -> None:
+    """Test that sitemap_tree_for_homepage() fetches everything with the web client it was given."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_index.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_index.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <sitemap><loc>{TEST_BASE_URL}/sitemap_pages.xml</loc></sitemap>
+            </sitemapindex>
+            """,
+    )
+    httpx_mock.add_response(status_code=404)
+
+    with httpx.Client(headers={"User-Agent": "test-agent"}) as web_client:
+        sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/", web_client=web_client)
+
+    requests: list[httpx.Request] = httpx_mock.get_requests()
+    assert f"{TEST_BASE_URL}/sitemap_pages.xml" in {str(request.url) for request in requests}
+    assert {request.headers["User-Agent"] for request in requests} == {"test-agent"}
+
+
+def test_sitemap_tree_for_homepage_invalid_utf8(httpx_mock: HTTPXMock) -> None:
+    """Test that sitemaps with bytes that aren't valid UTF-8 still get parsed in full."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_pages.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_pages.xml",
+        content=(
+            b'\xef\xbb\xbf<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            b"    <url><loc>" + TEST_BASE_URL.encode() + b"/caf\xe9.html</loc></url>\n"
+            b"    <url><loc>" + TEST_BASE_URL.encode() + b"/contact.html</loc></url>\n"
+            b"</urlset>\n"
+        ),
+    )
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    assert [page.url for page in actual_sitemap_tree.all_pages()] == [
+        f"{TEST_BASE_URL}/caf\ufffd.html",
+        f"{TEST_BASE_URL}/contact.html",
+    ]
+
+
+def test_sitemap_tree_for_homepage_truncated_latin1(httpx_mock: HTTPXMock) -> None:
+    """Test that a sitemap in an encoding other than UTF-8 gets decoded as declared even if it's cut off."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_pages.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_pages.xml",
+        content=(
+            b'<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            b"    <url><loc>" + TEST_BASE_URL.encode() + b"/caf\xe9.html</loc></url>\n"
+            b"    <url><loc>" + TEST_BASE_URL.encode() + b"/contact"
+        ),
+    )
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    assert [page.url for page in actual_sitemap_tree.all_pages()] == [f"{TEST_BASE_URL}/caf\u00e9.html"]
+
+
+def test_sitemap_tree_for_homepage_internal_entity(httpx_mock: HTTPXMock) -> None:
+    """Test that entities declared in the sitemap's internal DTD get expanded."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_pages.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_pages.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <!DOCTYPE urlset [<!ENTITY base "{TEST_BASE_URL}">]>
+            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <url><loc>&base;/about.html</loc></url>
+            </urlset>
+            """,
+    )
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    assert [page.url for page in actual_sitemap_tree.all_pages()] == [f"{TEST_BASE_URL}/about.html"]
+
+
+def test_sitemap_tree_for_homepage_rss_atom(httpx_mock: HTTPXMock) -> None:
+    """Test sitemap_tree_for_homepage() with RSS and Atom feeds that repeat some of their links."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_rss.xml\nSitemap: {TEST_BASE_URL}/sitemap_atom.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_rss.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <rss version="2.0">
+                <channel>
+                    <item><link>{TEST_BASE_URL}/rss_1.html</link><title>First</title></item>
+                    <item><link>{TEST_BASE_URL}/rss_2.html</link><title>Second</title></item>
+                    <item><link>{TEST_BASE_URL}/rss_1.html</link><title>First again</title></item>
+                </channel>
+            </rss>
+            """,
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_atom.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom">
+                <entry><link href="{TEST_BASE_URL}/atom_1.html"/><title>First</title></entry>
+                <entry><link href="{TEST_BASE_URL}/atom_1.html"/><title>First again</title></entry>
+                <entry><link href="{TEST_BASE_URL}/atom_2.html"/><summary>Second</summary></entry>
+            </feed>
+            """,
+    )
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    rss_sitemap, atom_sitemap = actual_sitemap_tree.sub_sitemaps[0].sub_sitemaps
+    assert isinstance(rss_sitemap, PagesRSSSitemap)
+    assert isinstance(atom_sitemap, PagesAtomSitemap)
+
+    assert [(page.url, page.news_story.title) for page in rss_sitemap.pages] == [
+        (f"{TEST_BASE_URL}/rss_1.html", "First"),
+        (f"{TEST_BASE_URL}/rss_2.html", "Second"),
+    ]
+    assert [(page.url, page.news_story.title) for page in atom_sitemap.pages] == [
+        (f"{TEST_BASE_URL}/atom_1.html", "First"),
+        (f"{TEST_BASE_URL}/atom_2.html", "Second"),
+    ]
+
+    # News stories are hashable, so the same stories from both feeds can be deduplicated
+    assert {page.news_story for page in rss_sitemap.pages} == {page.news_story for page in atom_sitemap.pages}
+
+
+def test_sitemap_tree_for_homepage_retry(httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that sitemaps get fetched again after temporary errors, backing off between the retries."""
+    delays: list[float] = []
+    monkeypatch.setattr("usp.fetch_parse.time.sleep", delays.append)
+
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_pages.xml\nSitemap: {TEST_BASE_URL}/sitemap_down.xml\n",
+    )
+    httpx_mock.add_response(url=f"{TEST_BASE_URL}/sitemap_pages.xml", status_code=503, headers={"Retry-After": "5"})
+    httpx_mock.add_response(url=f"{TEST_BASE_URL}/sitemap_pages.xml", status_code=502)
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_pages.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <url><loc>{TEST_BASE_URL}/about.html</loc></url>
+            </urlset>
+            """,
+    )
+    for _ in range(3):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/sitemap_down.xml", status_code=503)
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    pages_sitemap, down_sitemap = actual_sitemap_tree.sub_sitemaps[0].sub_sitemaps
+    assert isinstance(pages_sitemap, PagesXMLSitemap)
+    assert [page.url for page in pages_sitemap.pages] == [f"{TEST_BASE_URL}/about.html"]
+
+    # Sitemap that keeps failing gets fetched once plus two retries, and is invalid after that
+    assert isinstance(down_sitemap, InvalidSitemap)
+    down_requests = httpx_mock.get_requests(url=f"{TEST_BASE_URL}/sitemap_down.xml")
+    assert len(down_requests) == 3  # noqa: PLR2004
+
+    # Retry-After is honored, otherwise the delay doubles with every retry plus up to a second of jitter
+    assert 5.0 in delays  # noqa: PLR2004
+    delays.remove(5.0)
+    assert sorted(delay // 1 for delay in delays) == [1.0, 2.0, 2.0]
+
+
+def test_sitemap_tree_for_homepage_retry_timeout(httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that sitemaps get fetched again after timeouts, and that Retry-After can be an HTTP date."""
+    delays: list[float] = []
+    monkeypatch.setattr("usp.fetch_parse.time.sleep", delays.append)
+
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_slow.xml\n",
+    )
+    httpx_mock.add_exception(httpx.ReadTimeout("Timed out"), url=f"{TEST_BASE_URL}/sitemap_slow.xml")
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_slow.xml",
+        status_code=429,
+        headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_slow.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <url><loc>{TEST_BASE_URL}/about.html</loc></url>
+            </urlset>
+            """,
+    )
+    httpx_mock.add_response(status_code=404)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    pages_sitemap: AbstractSitemap = actual_sitemap_tree.sub_sitemaps[0].sub_sitemaps[0]
+    assert isinstance(pages_sitemap, PagesXMLSitemap)
+    assert [page.url for page in pages_sitemap.pages] == [f"{TEST_BASE_URL}/about.html"]
+
+    # Timeout backs off as usual, Retry-After date in the past means retrying right away
+    assert len(delays) == 2  # noqa: PLR2004
+    assert 1.0 <= delays[0] < 2.0  # noqa: PLR2004
+    assert delays[1] == 0.0  # noqa: PLR2004
+
+
+def test_sitemap_tree_for_homepage_failing_host(httpx_mock: HTTPXMock) -> None:
+    """Test that sitemaps from a host that keeps failing get skipped instead of fetched one by one."""
+    sitemap_count = 12
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text="User-agent: *\n" + "".join(f"Sitemap: {TEST_BASE_URL}/sitemap_{i}.xml\n" for i in range(sitemap_count)),
+    )
+    httpx_mock.add_response(status_code=500)
+
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    sub_sitemaps: list[AbstractSitemap] = actual_sitemap_tree.sub_sitemaps[0].sub_sitemaps
+    assert len(sub_sitemaps) == sitemap_count
+    assert all(isinstance(sitemap, InvalidSitemap) for sitemap in sub_sitemaps)
+
+    # Once enough fetches in a row have failed, the remaining sitemaps don't get fetched at all
+    sitemap_requests = [request for request in httpx_mock.get_requests() if "/sitemap_" in request.url.path]
+    assert len(sitemap_requests) < sitemap_count
+    assert any("keeps failing" in sitemap.reason for sitemap in sub_sitemaps)  # type: ignore  # noqa: PGH003
+
+    # Failures are only remembered within a single crawl, so the next one starts by fetching robots.txt again
+    sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/robots.txt")) == 2  # noqa: PLR2004
+
+
+def test_sitemap_tree_for_homepage_invalid_page(httpx_mock: HTTPXMock) -> None:
+    """Test that a page with an invalid value gets skipped without cutting off the rest of the sitemap."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_pages.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_pages.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <url><loc>{TEST_BASE_URL}/first.html</loc></url>
+                <url>
+                    <loc>{TEST_BASE_URL}/bad_lastmod.html</loc>
+                    <lastmod>not a date</lastmod>
+                </url>
+                <url>
+                    <loc>{TEST_BASE_URL}/bad_priority.html</loc>
+                    <priority>high</priority>
+                </url>
+                <url><loc>{TEST_BASE_URL}/last.html</loc></url>
+            </urlset>
+            """,
+    )
+    httpx_mock.add_response(status_code=404)
 
-    try:
-        gzipped_data: bytes = gzip_lib.compress(data, compresslevel=9)
-    except Exception as ex:  # noqa: BLE001
-        raise Exception("Unable to gzip data: %s" % str(ex)) from ex  # noqa: TRY002
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    pages_sitemap: AbstractSitemap = actual_sitemap_tree.sub_sitemaps[0].sub_sitemaps[0]
+    assert isinstance(pages_sitemap, PagesXMLSitemap)
+    assert [page.url for page in pages_sitemap.pages] == [f"{TEST_BASE_URL}/first.html", f"{TEST_BASE_URL}/last.html"]
 
-    if gzipped_data is None:
-        msg = "Gzipped data is None."
-        raise TypeError(msg)
 
-    if not isinstance(gzipped_data, bytes):
-        msg = "Gzipped data is not bytes."
-        raise TypeError(msg)
+def test_sitemap_tree_for_homepage_rss_atom_invalid_date(httpx_mock: HTTPXMock) -> None:
+    """Test that a feed item with an invalid date gets skipped without cutting off the rest of the feed."""
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/robots.txt",
+        text=f"User-agent: *\nSitemap: {TEST_BASE_URL}/sitemap_rss.xml\nSitemap: {TEST_BASE_URL}/sitemap_atom.xml\n",
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_rss.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <rss version="2.0">
+                <channel>
+                    <item><link>{TEST_BASE_URL}/rss_1.html</link><title>First</title></item>
+                    <item>
+                        <link>{TEST_BASE_URL}/rss_bad.html</link>
+                        <title>Bad</title>
+                        <pubDate>not a date</pubDate>
+                    </item>
+                    <item><link>{TEST_BASE_URL}/rss_2.html</link><title>Second</title></item>
+                </channel>
+            </rss>
+            """,
+    )
+    httpx_mock.add_response(
+        url=f"{TEST_BASE_URL}/sitemap_atom.xml",
+        text=f"""<?xml version="1.0" encoding="UTF-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom">
+                <entry><link href="{TEST_BASE_URL}/atom_1.html"/><title>First</title></entry>
+                <entry>
+                    <link href="{TEST_BASE_URL}/atom_bad.html"/>
+                    <title>Bad</title>
+                    <updated>not a date</updated>
+                </entry>
+                <entry><link href="{TEST_BASE_URL}/atom_2.html"/><title>Second</title></entry>
+            </feed>
+            """,
+    )
+    httpx_mock.add_response(status_code=404)
 
-    return gzipped_data
+    actual_sitemap_tree: AbstractSitemap = sitemap_tree_for_homepage(homepage_url=f"{TEST_BASE_URL}/")
+    rss_sitemap, atom_sitemap = actual_sitemap_tree.sub_sitemaps[0].sub_sitemaps
+    assert isinstance(rss_sitemap, PagesRSSSitemap)
+    assert isinstance(atom_sitemap, PagesAtomSitemap)
+    assert [page.url for page in rss_sitemap.pages] == [f"{TEST_BASE_URL}/rss_1.html", f"{TEST_BASE_URL}/rss_2.html"]
+    assert [page.url for page in atom_sitemap.pages] == [f"{TEST_BASE_URL}/atom_1.html", f"{TEST_BASE_URL}/atom_2.html"]
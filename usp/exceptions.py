@@ -11,5 +11,9 @@ class SitemapXMLParsingExceptionError(Exception):
     """XML parsing exception to be handled gracefully."""
 
 
+class StripURLToHomepageExceptionError(Exception):
+    """Problem parsing URL and stripping to homepage."""
+
+
 class GunzipExceptionError(Exception):
     """gunzip() exception."""
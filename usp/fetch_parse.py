@@ -2,17 +2,25 @@
 from __future__ import annotations
 
 import abc
+import atexit
+import datetime
+import email.utils
+import random
 import re
+import sys
+import threading
+import time
 import xml.parsers.expat
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import urlsplit
 
-import httpx
-from httpx import Client
+from httpx import TimeoutException, TransportError
 from loguru import logger as log
 
-from usp.http_client import get_http_client
+from usp.http_client import get_http_client, read_response_data
 
 from .exceptions import SitemapExceptionError, SitemapXMLParsingExceptionError
 from .helpers import (
@@ -20,7 +28,7 @@ from .helpers import (
     is_http_url,
     parse_iso8601_date,
     parse_rfc2822_date,
-    ungzipped_response_content,
+    ungzipped_response_bytes,
 )
 from .objects.page import (
     SITEMAP_PAGE_DEFAULT_PRIORITY,
@@ -40,25 +48,253 @@ from .objects.sitemap import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from httpx import Client
     from pyexpat import XMLParserType
 
 
+_DEFAULT_CLIENT: Client | None = None
+"""HTTP client shared by all fetchers that weren't given one, so that connections get reused between sitemaps."""
+
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+_CHANGE_FREQUENCIES: dict[str, SitemapPageChangeFrequency] = {
+    change_frequency.value: change_frequency for change_frequency in SitemapPageChangeFrequency
+}
+"""Change frequencies by their lowercase value, to look up <changefreq> once per page."""
+
+_PRIORITY_MIN = Decimal("0.0")
+_PRIORITY_MAX = Decimal("1.0")
+
+_PRIORITIES: dict[str, Decimal] = {
+    **{priority: Decimal(priority) for priority in ("0", "1", *(f"0.{i}" for i in range(10)), "1.0")},
+    "0.5": SITEMAP_PAGE_DEFAULT_PRIORITY,
+}
+"""Commonly used <priority> values, so that pages with the same priority share a single Decimal instance."""
+
+
+def _char_data_unset_error(name: str) -> SitemapXMLParsingExceptionError:
+    """Return exception to raise when an element that must have character data ends without any.
+
+    Args:
+        name: XML element name.
+
+    Returns:
+        Exception to raise.
+    """
+    msg: str = f"Character data is expected to be set at the end of <{name}>."
+    return SitemapXMLParsingExceptionError(msg)
+
+
+def _retry_after_delay(retry_after: str) -> float | None:
+    """Return number of seconds to wait as asked for in a Retry-After header.
+
+    Args:
+        retry_after: Value of the Retry-After header, either a number of seconds or an HTTP date.
+
+    Returns:
+        Delay in seconds (zero if the date has passed already), or None if the value is invalid.
+    """
+    retry_after = retry_after.strip()
+    if retry_after.isascii() and retry_after.isdigit():
+        return float(retry_after)
+
+    try:
+        retry_date: datetime.datetime = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    # HTTP dates are always in GMT, but the header might be malformed
+    if retry_date.tzinfo is None:
+        return None
+
+    return max((retry_date - datetime.datetime.now(tz=datetime.UTC)).total_seconds(), 0.0)
+
+
+def _default_web_client() -> Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    Returns:
+        HTTP client.
+    """
+    global _DEFAULT_CLIENT  # noqa: PLW0603
+    with _DEFAULT_CLIENT_LOCK:
+        if _DEFAULT_CLIENT is None:
+            _DEFAULT_CLIENT = get_http_client()
+            # Close pooled connections cleanly instead of leaving them to the garbage collector at shutdown
+            atexit.register(_DEFAULT_CLIENT.close)
+
+    return _DEFAULT_CLIENT
+
+
+class CrawlState:
+    """State shared by the fetchers of a single sitemap tree crawl.
+
+    Kept per crawl instead of globally so that e.g. a host that kept failing during one crawl doesn't get skipped by
+    unrelated crawls later on.
+    """
+
+    __HOST_FAILURE_THRESHOLD = 5
+    """Number of fetches from a host in a row that have to fail for the host's further sitemaps to be skipped."""
+
+    __HOST_FAILURE_BACKOFF = 30.0
+    """Number of seconds to skip a failing host's sitemaps for before trying to fetch from it again."""
+
+    __MAX_FETCH_THREADS = 32
+    """Max. number of threads fetching sitemaps concurrently, at all levels of index sitemaps combined."""
+
+    __MAX_CONCURRENT_FETCHES_PER_HOST = 4
+    """Max. number of requests to have in flight to a single host, across all threads."""
+
+    __slots__: list[str] = [
+        # Number of failed fetches in a row and monotonic time of the last of them, by host
+        "__host_failures",
+        # Semaphores limiting the number of concurrent requests, by host
+        "__host_semaphores",
+        # Number of fetch threads that can still be started
+        "__free_fetch_threads",
+        "__lock",
+    ]
+
+    def __init__(self: CrawlState) -> None:
+        """Constructor.
+
+        Args:
+            self: Sitemap tree crawl state.
+        """
+        self.__host_failures: dict[str, tuple[int, float]] = {}
+        self.__host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self.__free_fetch_threads: int = self.__MAX_FETCH_THREADS
+        self.__lock = threading.Lock()
+
+    def acquire_fetch_threads(self: CrawlState, count: int) -> int:
+        """Take up to the requested number of fetch threads from the crawl's budget without waiting for any.
+
+        Args:
+            self: Sitemap tree crawl state.
+            count: Number of threads wanted.
+
+        Returns:
+            Number of threads that can be started, possibly zero; to be released once they've finished.
+        """
+        with self.__lock:
+            acquired_count: int = min(count, self.__free_fetch_threads)
+            self.__free_fetch_threads -= acquired_count
+
+        return acquired_count
+
+    def release_fetch_threads(self: CrawlState, count: int) -> None:
+        """Return fetch threads to the crawl's budget.
+
+        Args:
+            self: Sitemap tree crawl state.
+            count: Number of threads that have finished, as returned by acquire_fetch_threads().
+        """
+        with self.__lock:
+            self.__free_fetch_threads += count
+
+    def host_semaphore(self: CrawlState, host: str) -> threading.BoundedSemaphore:
+        """Return semaphore which limits the number of concurrent requests to a host.
+
+        Args:
+            self: Sitemap tree crawl state.
+            host: Lowercase host (and port, if any) of the URL that is about to be fetched.
+
+        Returns:
+            Semaphore for the host.
+        """
+        with self.__lock:
+            semaphore: threading.BoundedSemaphore | None = self.__host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.__MAX_CONCURRENT_FETCHES_PER_HOST)
+                self.__host_semaphores[host] = semaphore
+
+        return semaphore
+
+    def host_is_failing(self: CrawlState, host: str) -> bool:
+        """Return True if sitemaps from a host should be skipped because fetching from it keeps failing.
+
+        Once the backoff is over, sitemaps get fetched from the host again; another failure skips it for another
+        backoff period, while a success resets its failure count.
+
+        Args:
+            self: Sitemap tree crawl state.
+            host: Lowercase host (and port, if any) of the URL that is about to be fetched.
+
+        Returns:
+            True if the host's sitemaps should be skipped for now.
+        """
+        with self.__lock:
+            failure_count, last_failure_time = self.__host_failures.get(host, (0, 0.0))
+
+        return (
+            failure_count >= self.__HOST_FAILURE_THRESHOLD
+            and time.monotonic() - last_failure_time < self.__HOST_FAILURE_BACKOFF
+        )
+
+    def record_host_fetch(self: CrawlState, host: str, *, failed: bool) -> None:
+        """Record whether fetching from a host has failed, to be able to skip hosts that are down.
+
+        Args:
+            self: Sitemap tree crawl state.
+            host: Lowercase host (and port, if any) of the fetched URL.
+            failed: True if the fetch failed because of the host, e.g. a server error or a timeout.
+        """
+        with self.__lock:
+            if not failed:
+                self.__host_failures.pop(host, None)
+                return
+
+            failure_count: int = self.__host_failures.get(host, (0, 0.0))[0] + 1
+            self.__host_failures[host] = (failure_count, time.monotonic())
+
+        if failure_count == self.__HOST_FAILURE_THRESHOLD:
+            log.warning(f"Fetching from {host} failed {failure_count} times in a row, skipping it for a while...")
+
+
 class SitemapFetcher:
     """robots.txt / XML / plain text sitemap fetcher."""
 
+    __MAX_SITEMAP_SIZE = 100 * 1024 * 1024
+    """Max. uncompressed sitemap size.
+
+    Spec says it might be up to 50 MB but let's go for the full 100 MB here."""
+
     __MAX_RECURSION_LEVEL = 10
     """Max. recursion level in iterating over sub-sitemaps."""
 
+    __MAX_FETCH_WORKERS = 10
+    """Max. number of sitemaps to fetch concurrently from a single index sitemap."""
+
+    __RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+    """HTTP status codes of temporary errors after which the sitemap gets fetched again."""
+
+    __MAX_RETRIES = 2
+    """Max. number of times to fetch a sitemap again after a temporary error or a timeout."""
+
+    __RETRY_DELAY = 1.0
+    """Delay (in seconds) before the first retry; every further retry waits twice as long, plus some jitter."""
+
+    __MAX_RETRY_DELAY = 60.0
+    """Max. delay (in seconds) before a retry, also caps the delay asked for in Retry-After."""
+
+    __XML_CONTENT_REGEX = re.compile(rb"(?:\xef\xbb\xbf)?\s{0,19}<")
+    """Matches content that starts with "<" after an optional BOM and whitespace within its first 20 characters."""
+
     __slots__: list[str] = [
         "_url",
         "_recursion_level",
         "_web_client",
+        "_crawl_state",
     ]
 
     def __init__(
         self: SitemapFetcher,
         url: str,
         recursion_level: int,
+        web_client: Client | None = None,
+        crawl_state: CrawlState | None = None,
     ) -> None:
         """Constructor.
 
@@ -66,7 +302,8 @@ class SitemapFetcher:
             self: robots.txt / XML / plain text sitemap fetcher.
             url: URL of the sitemap to fetch.
             recursion_level: Recursion level in iterating over sub-sitemaps.
-            web_client: Web client implementation to use for fetching sitemaps.
+            web_client: Web client to use for fetching sitemaps, defaults to a client shared by all fetchers.
+            crawl_state: State of the crawl that the sitemap is fetched as part of, defaults to a new crawl.
 
         Raises:
             SitemapException: If the URL is not a HTTP(s) URL.
@@ -81,8 +318,9 @@ class SitemapFetcher:
             raise SitemapExceptionError(msg)
 
         self._url: str = url
-        self._web_client: Client = get_http_client()
+        self._web_client: Client = web_client or _default_web_client()
         self._recursion_level: int = recursion_level
+        self._crawl_state: CrawlState = crawl_state or CrawlState()
 
     def sitemap(self: SitemapFetcher) -> AbstractSitemap:
         """Fetch sitemap.
@@ -93,66 +331,233 @@ class SitemapFetcher:
         Returns:
             Sitemap object.
         """
-        log.info(f"Fetching level {self._recursion_level} sitemap from {self._url}...")
-        response: httpx.Response = httpx.get(self._url)
+        host: str = urlsplit(self._url).netloc.lower()
 
-        if response.is_error:
-            return InvalidSitemap(
+        log.info(f"Fetching level {self._recursion_level} sitemap from {self._url}...")
+        for retry in range(self.__MAX_RETRIES + 1):
+            try:
+                with self._crawl_state.host_semaphore(host):
+                    # Check only once it's this fetch's turn, as other fetches from the host might have failed meanwhile
+                    if self._crawl_state.host_is_failing(host):
+                        return InvalidSitemap(
+                            url=self._url,
+                            reason=f"Skipped sitemap from {self._url}: fetching from {host} keeps failing",
+                        )
+
+                    with self._web_client.stream("GET", self._url) as response:
+                        if response.status_code in self.__RETRYABLE_STATUS_CODES and retry < self.__MAX_RETRIES:
+                            failure: str = str(response.status_code)
+                            delay: float = self.__retry_delay(
+                                retry=retry,
+                                retry_after=response.headers.get("Retry-After"),
+                            )
+
+                        elif response.is_error:
+                            # Missing sitemaps are to be expected, but server errors mean that the host might be down
+                            self._crawl_state.record_host_fetch(
+                                host=host,
+                                failed=(
+                                    response.is_server_error or response.status_code in self.__RETRYABLE_STATUS_CODES
+                                ),
+                            )
+                            return InvalidSitemap(
+                                url=self._url,
+                                reason=(
+                                    f"Unable to fetch sitemap from {self._url}: "
+                                    f"{response.status_code} {response.reason_phrase}"
+                                ),
+                            )
+
+                        else:
+                            # Stop downloading once the limit is reached instead of reading the whole response and
+                            # trimming it
+                            response_data: bytes = read_response_data(
+                                response=response,
+                                max_length=self.__MAX_SITEMAP_SIZE,
+                            )
+                            break
+
+            except TransportError as ex:
+                # Timeouts might be temporary, failing to connect etc. most likely isn't
+                if not isinstance(ex, TimeoutException) or retry == self.__MAX_RETRIES:
+                    self._crawl_state.record_host_fetch(host=host, failed=True)
+                    raise
+
+                failure = ex.__class__.__name__
+                delay = self.__retry_delay(retry=retry, retry_after=None)
+
+            # Wait outside of the host semaphore so that other sitemaps from the same host can be fetched meanwhile
+            log.warning(f"Fetching sitemap from {self._url} failed with {failure}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+        self._crawl_state.record_host_fetch(host=host, failed=False)
+
+        parser: AbstractSitemapParser = self.__parser(
+            content=ungzipped_response_bytes(
                 url=self._url,
-                reason=f"Unable to fetch sitemap from {self._url}: {response.status_code} {response.reason_phrase}",
-            )
-
-        response_content: str = ungzipped_response_content(
-            url=self._url,
-            response=response,  # type: ignore  # noqa: PGH003
+                response=response,  # type: ignore  # noqa: PGH003
+                content=response_data,
+            ),
         )
 
+        # Parser owns the content from now on and lets go of it before fetching any sub-sitemaps, so don't hold on to
+        # another reference to it here while they're being fetched
+        del response_data
+
+        log.info(f"Parsing sitemap from URL {self._url}...")
+        return parser.sitemap()
+
+    @classmethod
+    def __retry_delay(cls: type[SitemapFetcher], retry: int, retry_after: str | None) -> float:
+        """Return number of seconds to wait before fetching a sitemap again after a temporary error.
+
+        Exponential backoff with jitter keeps the retries of many concurrent fetches from hitting the server all at
+        once again.
+
+        Args:
+            cls: robots.txt / XML / plain text sitemap fetcher class.
+            retry: Number of retries done so far.
+            retry_after: Value of the response's Retry-After header, if any.
+
+        Returns:
+            Delay in seconds.
+        """
+        if retry_after:
+            retry_after_delay: float | None = _retry_after_delay(retry_after)
+            if retry_after_delay is not None:
+                return min(retry_after_delay, cls.__MAX_RETRY_DELAY)
+
+        delay: float = cls.__RETRY_DELAY * 2**retry + random.uniform(0, cls.__RETRY_DELAY)  # noqa: S311
+        return min(delay, cls.__MAX_RETRY_DELAY)
+
+    def __parser(self: SitemapFetcher, content: bytes) -> AbstractSitemapParser:
+        """Return parser for the fetched sitemap content.
+
+        Args:
+            self: robots.txt / XML / plain text sitemap fetcher.
+            content: Fetched and (if necessary) gunzipped sitemap content.
+
+        Returns:
+            Parser of the sitemap type that the content looks like.
+        """
         # MIME types returned in Content-Type are unpredictable, so peek into the content instead
-        if response_content[:20].strip().startswith("<"):
-            # XML sitemap (the specific kind is to be determined later)
-            parser = XMLSitemapParser(
+        if self.__XML_CONTENT_REGEX.match(content):
+            # XML sitemap (the specific kind is to be determined later); XML parsers decode the bytes themselves
+            return XMLSitemapParser(
                 url=self._url,
-                content=response_content,
+                content=content,
                 recursion_level=self._recursion_level,
+                web_client=self._web_client,
+                crawl_state=self._crawl_state,
             )
 
-        else:  # noqa: PLR5501
-            # Assume that it's some sort of a text file (robots.txt or plain text sitemap)
-            if self._url.endswith("/robots.txt"):
-                parser = IndexRobotsTxtSitemapParser(
-                    url=self._url,
-                    content=response_content,
-                    recursion_level=self._recursion_level,
-                )
-            else:
-                parser = PlainTextSitemapParser(
-                    url=self._url,
-                    content=response_content,
-                    recursion_level=self._recursion_level,
+        # Assume that it's some sort of a text file (robots.txt or plain text sitemap)
+        # TODO: other encodings
+        text_content: str = content.decode("utf-8-sig", errors="replace")
+        if self._url.endswith("/robots.txt"):
+            return IndexRobotsTxtSitemapParser(
+                url=self._url,
+                content=text_content,
+                recursion_level=self._recursion_level,
+                web_client=self._web_client,
+                crawl_state=self._crawl_state,
+            )
+
+        return PlainTextSitemapParser(
+            url=self._url,
+            content=text_content,
+            recursion_level=self._recursion_level,
+            web_client=self._web_client,
+            crawl_state=self._crawl_state,
+        )
+
+    @classmethod
+    def sitemaps(
+        cls: type[SitemapFetcher],
+        urls: list[str],
+        recursion_level: int,
+        web_client: Client | None = None,
+        crawl_state: CrawlState | None = None,
+    ) -> list[AbstractSitemap]:
+        """Fetch multiple sitemaps concurrently.
+
+        Sitemaps that couldn't be fetched (e.g. because the recursion limit was reached) are returned as
+        InvalidSitemap objects instead of raising.
+
+        Args:
+            cls: robots.txt / XML / plain text sitemap fetcher class.
+            urls: URLs of the sitemaps to fetch.
+            recursion_level: Recursion level in iterating over sub-sitemaps.
+            web_client: Web client to use for fetching sitemaps, defaults to a client shared by all fetchers.
+            crawl_state: State of the crawl that the sitemaps are fetched as part of, defaults to a new crawl.
+
+        Returns:
+            Sitemap objects, in the same order as the URLs.
+        """
+        if crawl_state is None:
+            crawl_state = CrawlState()
+
+        def fetch(url: str) -> AbstractSitemap:
+            # URL might be invalid, or recursion limit might have been reached
+            try:
+                fetcher = cls(
+                    url=url,
+                    recursion_level=recursion_level,
+                    web_client=web_client,
+                    crawl_state=crawl_state,
                 )
+                return fetcher.sitemap()
+            except Exception as ex:  # noqa: BLE001
+                return InvalidSitemap(url=url, reason=f"Unable to add sub-sitemap from URL {url}: {ex!s}")
 
-        log.info(f"Parsing sitemap from URL {self._url}...")
-        return parser.sitemap()
+        if len(urls) <= 1:
+            return [fetch(url) for url in urls]
+
+        # Index sitemaps fetched by the threads fetch their own sub-sitemaps concurrently too, so threads come from a
+        # budget shared by the whole crawl; once it's used up, sitemaps get fetched one by one in the current thread
+        # instead of waiting for threads to free up, which could deadlock with threads waiting for their children
+        thread_count: int = crawl_state.acquire_fetch_threads(min(len(urls), cls.__MAX_FETCH_WORKERS))
+        if not thread_count:
+            return [fetch(url) for url in urls]
+
+        try:
+            with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                return list(executor.map(fetch, urls))
+        finally:
+            crawl_state.release_fetch_threads(thread_count)
 
 
 class AbstractSitemapParser(metaclass=abc.ABCMeta):
     """Abstract robots.txt / XML / plain text sitemap parser."""
 
-    __slots__: list[str] = ["_url", "_content", "_web_client", "_recursion_level"]
+    __LINE_REGEX: re.Pattern[str] = re.compile(r"[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]+")
+    """Regular expression to match non-empty lines, split at the same line boundaries as str.splitlines()."""
+
+    __slots__: list[str] = ["_url", "_content", "_web_client", "_crawl_state", "_recursion_level"]
 
-    def __init__(self: AbstractSitemapParser, url: str, content: str, recursion_level: int) -> None:
+    def __init__(  # noqa: PLR0913
+        self: AbstractSitemapParser,
+        url: str,
+        content: str | bytes,
+        recursion_level: int,
+        web_client: Client,
+        crawl_state: CrawlState,
+    ) -> None:
         """Constructor.
 
         Args:
             self: Abstract robots.txt / XML / plain text sitemap parser.
             url: URL of the sitemap to parse.
-            content: Content of the sitemap to parse.
+            content: Content of the sitemap to parse, either decoded or as raw bytes.
             recursion_level: Recursion level in iterating over sub-sitemaps.
             web_client: Web client implementation to use for fetching sitemaps.
+            crawl_state: State of the crawl that the sitemap is parsed as part of.
         """
         self._url: str = url
-        self._content: str = content
+        self._content: str | bytes = content
         self._recursion_level: int = recursion_level
+        self._web_client: Client = web_client
+        self._crawl_state: CrawlState = crawl_state
 
     @abc.abstractmethod
     def sitemap(self: AbstractSitemapParser) -> AbstractSitemap:
@@ -170,15 +575,34 @@ class AbstractSitemapParser(metaclass=abc.ABCMeta):
         msg = "Abstract method."
         raise NotImplementedError(msg)
 
+    def _stripped_content_lines(self: AbstractSitemapParser) -> Iterator[str]:
+        """Yield non-empty lines of the content with surrounding whitespace stripped.
+
+        Lines are found one by one instead of splitting the whole content into a list of lines up front.
+
+        Args:
+            self: Abstract robots.txt / XML / plain text sitemap parser.
+
+        Yields:
+            Stripped line of the content.
+        """
+        for line_match in self.__LINE_REGEX.finditer(self._content):  # type: ignore # noqa: PGH003
+            yield line_match.group().strip()
+
 
 class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
     """robots.txt index sitemap parser."""
 
-    def __init__(
+    __SITEMAP_LINE_REGEX: re.Pattern[str] = re.compile(r"^site-?map:\s*(.+?)$", re.IGNORECASE)
+    """Regular expression to match "Sitemap: <url>" lines."""
+
+    def __init__(  # noqa: PLR0913
         self: IndexRobotsTxtSitemapParser,
         url: str,
         content: str,
         recursion_level: int,
+        web_client: Client,
+        crawl_state: CrawlState,
     ) -> None:
         """Constructor.
 
@@ -188,11 +612,18 @@ class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
             content: Content of the sitemap to parse.
             recursion_level: Recursion level in iterating over sub-sitemaps.
             web_client: Web client implementation to use for fetching sitemaps.
+            crawl_state: State of the crawl that the sitemap is parsed as part of.
 
         Raises:
             SitemapException: If the URL does not look like a robots.txt URL.
         """
-        super().__init__(url=url, content=content, recursion_level=recursion_level)
+        super().__init__(
+            url=url,
+            content=content,
+            recursion_level=recursion_level,
+            web_client=web_client,
+            crawl_state=crawl_state,
+        )
 
         if not self._url.endswith("/robots.txt"):
             msg: str = f"URL does not look like robots.txt URL: {self._url}"
@@ -208,14 +639,14 @@ class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
             Sitemap object.
         """
         # Serves as an ordered set because we want to deduplicate URLs but also retain the order
-        sitemap_urls = OrderedDict()
+        sitemap_urls: dict[str, bool] = {}
 
-        for robots_txt_line in self._content.splitlines():
-            sitemap_match: re.Match[str] | None = re.search(
-                r"^site-?map:\s*(.+?)$",
-                robots_txt_line.strip().lower(),
-                flags=re.IGNORECASE,
-            )
+        for stripped_robots_txt_line in self._stripped_content_lines():
+            # Skip "User-agent:", "Disallow:" etc. lines without running the regex
+            if stripped_robots_txt_line[:1] not in {"s", "S"}:
+                continue
+
+            sitemap_match: re.Match[str] | None = self.__SITEMAP_LINE_REGEX.match(stripped_robots_txt_line)
             if sitemap_match:
                 sitemap_url: str | Any = sitemap_match.group(1)
                 if is_http_url(sitemap_url):
@@ -223,12 +654,15 @@ class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
                 else:
                     log.warning(f"Sitemap URL {sitemap_url} doesn't look like an URL, skipping")
 
-        sub_sitemaps = []
+        # Let go of the content before sub-sitemaps get fetched
+        self._content = ""
 
-        for sitemap_url in sitemap_urls:
-            fetcher = SitemapFetcher(url=sitemap_url, recursion_level=self._recursion_level)
-            fetched_sitemap: AbstractSitemap = fetcher.sitemap()
-            sub_sitemaps.append(fetched_sitemap)
+        sub_sitemaps: list[AbstractSitemap] = SitemapFetcher.sitemaps(
+            urls=list(sitemap_urls),
+            recursion_level=self._recursion_level,
+            web_client=self._web_client,
+            crawl_state=self._crawl_state,
+        )
 
         return IndexRobotsTxtSitemap(url=self._url, sub_sitemaps=sub_sitemaps)
 
@@ -245,10 +679,10 @@ class PlainTextSitemapParser(AbstractSitemapParser):
         Returns:
             Sitemap object.
         """
-        story_urls = OrderedDict()
+        # Serves as an ordered set because we want to deduplicate URLs but also retain the order
+        story_urls: dict[str, bool] = {}
 
-        for story_url in self._content.splitlines():
-            stripped_story_url: str = story_url.strip()
+        for stripped_story_url in self._stripped_content_lines():
             if not stripped_story_url:
                 continue
             if is_http_url(stripped_story_url):
@@ -256,10 +690,7 @@ class PlainTextSitemapParser(AbstractSitemapParser):
             else:
                 log.warning(f"Story URL {stripped_story_url} doesn't look like an URL, skipping")
 
-        pages = []
-        for page_url in story_urls:
-            page = SitemapPage(url=page_url)
-            pages.append(page)
+        pages: list[SitemapPage] = [SitemapPage(url=page_url) for page_url in story_urls]
 
         return PagesTextSitemap(url=self._url, pages=pages)
 
@@ -269,21 +700,45 @@ class XMLSitemapParser(AbstractSitemapParser):
 
     __XML_NAMESPACE_SEPARATOR = " "
 
+    __FEED_CHUNK_SIZE = 64 * 1024
+    """Number of bytes (or characters) to feed to the XML parser at a time."""
+
+    __XML_DECLARATION_REGEX: re.Pattern[bytes] = re.compile(rb"(?:\xef\xbb\xbf)?\s*<\?xml\s[^>]*\?>")
+    """Matches XML declaration at the start of the content, after an optional BOM and whitespace."""
+
+    __XML_ENCODING_REGEX: re.Pattern[bytes] = re.compile(rb"""\sencoding\s*=\s*["']([A-Za-z][\w.-]*)["']""")
+    """Matches encoding declared in an XML declaration."""
+
     __slots__: list[str] = [
         "_concrete_parser",
     ]
 
-    def __init__(self: XMLSitemapParser, url: str, content: str, recursion_level: int) -> None:
+    def __init__(  # noqa: PLR0913
+        self: XMLSitemapParser,
+        url: str,
+        content: bytes | str,
+        recursion_level: int,
+        web_client: Client,
+        crawl_state: CrawlState,
+    ) -> None:
         """Constructor.
 
         Args:
             self: XML sitemap parser.
             url: URL of the sitemap to parse.
-            content: Content of the sitemap to parse.
+            content: Content of the sitemap to parse, preferably undecoded so that the XML parser can decode it while
+                parsing instead of the whole sitemap getting decoded into a string first.
             recursion_level: Recursion level in iterating over sub-sitemaps.
             web_client: Web client implementation to use for fetching sitemaps.
+            crawl_state: State of the crawl that the sitemap is parsed as part of.
         """
-        super().__init__(url=url, content=content, recursion_level=recursion_level)
+        super().__init__(
+            url=url,
+            content=content,
+            recursion_level=recursion_level,
+            web_client=web_client,
+            crawl_state=crawl_state,
+        )
 
         # Will be initialized when the type of sitemap is known
         self._concrete_parser = None
@@ -297,20 +752,22 @@ class XMLSitemapParser(AbstractSitemapParser):
         Returns:
             Sitemap object.
         """
-        parser: XMLParserType = xml.parsers.expat.ParserCreate(namespace_separator=self.__XML_NAMESPACE_SEPARATOR)
-        parser.StartElementHandler = self._xml_element_start
-        parser.EndElementHandler = self._xml_element_end
-        parser.CharacterDataHandler = self._xml_char_data
-
         try:
-            is_final = True
-            parser.Parse(self._content, is_final)
+            self.__parse_with_expat()
         except Exception as ex:  # noqa: BLE001
+            if self.__decode_content(parse_error=ex):
+                log.warning(f"Unable to decode sitemap from URL {self._url} while parsing it, parsing it again")
+                self._concrete_parser = None
+                return self.sitemap()
+
             # Some sitemap XML files might end abruptly because web servers might be
             # timing out on returning huge XML files so don't return InvalidSitemap()
             # but try to get as much pages as possible
             log.error(f"Parsing sitemap from URL {self._url} failed: {ex}")
 
+        # Everything has been parsed, so let go of the content before sub-sitemaps (if any) get fetched
+        self._content = self._content[:0]
+
         if not self._concrete_parser:
             return InvalidSitemap(
                 url=self._url,
@@ -319,10 +776,80 @@ class XMLSitemapParser(AbstractSitemapParser):
 
         return self._concrete_parser.sitemap()
 
+    def __decode_content(self: XMLSitemapParser, parse_error: Exception) -> bool:
+        """Decode content into a string, replacing undecodable bytes, if the XML parser failed because of its encoding.
+
+        That's the case if the content isn't valid in the encoding that it declares (UTF-8 if it doesn't declare any),
+        as the parser refuses to read past undecodable bytes, or if the parser doesn't support the declared encoding.
+        Content that decodes fine but failed to parse for another reason (e.g. because it got cut off) is left as it
+        is, as decoding it wouldn't get any more pages out of it.
+
+        Args:
+            self: XML sitemap parser.
+            parse_error: Exception that parsing the content failed with.
+
+        Returns:
+            True if the content was decoded, False if it was a string already or parsing failed for another reason.
+        """
+        if isinstance(self._content, str):
+            return False
+
+        declaration: re.Match[bytes] | None = self.__XML_DECLARATION_REGEX.match(self._content)
+        declared_encoding: re.Match[bytes] | None = (
+            self.__XML_ENCODING_REGEX.search(declaration.group()) if declaration else None
+        )
+        encoding: str = declared_encoding.group(1).decode("ascii") if declared_encoding else "utf-8-sig"
+
+        try:
+            self._content.decode(encoding)
+        except UnicodeDecodeError:
+            pass
+        except LookupError:
+            # Encoding is unknown to Python too, so the content can't be decoded here either
+            return False
+        else:
+            # Expat doesn't support multi-byte encodings other than UTF-8 and UTF-16, and raises ValueError for them
+            if not isinstance(parse_error, ValueError):
+                return False
+
+        # A string gets parsed as UTF-8, so drop the declaration instead of having its encoding apply a second time
+        start: int = declaration.end() if declaration else 0
+        self._content = self._content[start:].decode(encoding, errors="replace")
+        return True
+
+    def __parse_with_expat(self: XMLSitemapParser) -> None:
+        """Parse sitemap content with Expat.
+
+        Args:
+            self: XML sitemap parser.
+        """
+        parser: XMLParserType = xml.parsers.expat.ParserCreate(namespace_separator=self.__XML_NAMESPACE_SEPARATOR)
+        parser.StartElementHandler = self._xml_element_start
+        parser.EndElementHandler = self._xml_element_end
+        parser.CharacterDataHandler = self._xml_char_data
+
+        # Have Expat join character data split by newlines, entities and chunk boundaries itself and report it in a
+        # single call instead of calling the Python handler for every piece
+        parser.buffer_text = True
+        parser.buffer_size = self.__FEED_CHUNK_SIZE
+
+        # Feed the content in chunks so that Expat keeps working on a cache-sized piece of it at a time
+        for start in range(0, len(self._content), self.__FEED_CHUNK_SIZE):
+            end: int = start + self.__FEED_CHUNK_SIZE
+            parser.Parse(self._content[start:end], False)  # noqa: FBT003
+
+        is_final = True
+        parser.Parse(self._content[:0], is_final)
+
     @classmethod
+    @lru_cache(maxsize=1024)
     def __normalize_xml_element_name(cls: type[XMLSitemapParser], name: str) -> str:
         """Replace namespace URL in the argument element name with internal namespace.
 
+        Sitemaps use the same few element names over and over again, so normalized names are cached. They're also
+        interned, so comparing them to the element names in the handlers (and looking them up in the handlers' dicts)
+        mostly comes down to an identity check instead of comparing the strings character by character.
+
         * Elements from http://www.sitemaps.org/schemas/sitemap/0.9 namespace will be
           prefixed with "sitemap:", e.g. "<loc>" will become "<sitemap:loc>"
 
@@ -360,7 +887,7 @@ class XMLSitemapParser(AbstractSitemapParser):
             # We don't care about the rest of the namespaces, so just keep the plain element name
             pass
 
-        return name
+        return sys.intern(name)
 
     def _xml_element_start(
         self: XMLSitemapParser,
@@ -381,6 +908,8 @@ class XMLSitemapParser(AbstractSitemapParser):
                 self._concrete_parser = IndexXMLSitemapParser(
                     url=self._url,
                     recursion_level=self._recursion_level,
+                    web_client=self._web_client,
+                    crawl_state=self._crawl_state,
                 )
 
             elif name == "rss":
@@ -416,8 +945,8 @@ class AbstractXMLSitemapParser(metaclass=abc.ABCMeta):
     __slots__: list[str] = [
         # URL of the sitemap that is being parsed
         "_url",
-        # Last encountered character data
-        "_last_char_data",
+        # Fragments of the last encountered character data
+        "_last_char_data_parts",
         "_last_handler_call_was_xml_char_data",
     ]
 
@@ -429,7 +958,7 @@ class AbstractXMLSitemapParser(metaclass=abc.ABCMeta):
             url: URL of the sitemap that is being parsed.
         """
         self._url: str = url
-        self._last_char_data: str = ""
+        self._last_char_data_parts: list[str] = []
         self._last_handler_call_was_xml_char_data = False
 
     def xml_element_start(
@@ -454,7 +983,7 @@ class AbstractXMLSitemapParser(metaclass=abc.ABCMeta):
             name: XML element name.
         """
         # End of any element always resets last encountered character data
-        self._last_char_data = ""
+        self._last_char_data_parts = []
         self._last_handler_call_was_xml_char_data = False
 
     def xml_char_data(self: AbstractXMLSitemapParser, data: str) -> None:
@@ -466,14 +995,45 @@ class AbstractXMLSitemapParser(metaclass=abc.ABCMeta):
         """
         # Handler might be called multiple times for what essentially is a single
         # string, e.g. in case of entities ("ABC &amp; DEF"), so this is why
-        # we're appending
+        # we're appending; fragments get joined only once the data is read
         if self._last_handler_call_was_xml_char_data:
-            self._last_char_data += data
+            self._last_char_data_parts.append(data)
         else:
-            self._last_char_data = data
+            self._last_char_data_parts = [data]
 
         self._last_handler_call_was_xml_char_data = True
 
+    @property
+    def _last_char_data(self: AbstractXMLSitemapParser) -> str:
+        """Return last encountered character data.
+
+        Args:
+            self: Abstract XML sitemap parser.
+
+        Returns:
+            Character data since the last element start or end.
+        """
+        return "".join(self._last_char_data_parts)
+
+    def _build_page(self: AbstractXMLSitemapParser, current_page: Any) -> SitemapPage | None:  # noqa: ANN401
+        """Return sitemap page built from the page that has just been parsed.
+
+        Pages are built while the sitemap is still being parsed, so an invalid value (e.g. an unparseable date) in
+        one of them gets logged and only that page gets skipped instead of parsing of the whole sitemap stopping.
+
+        Args:
+            self: Abstract XML sitemap parser.
+            current_page: Page that has just been parsed, i.e. an instance of the parser's Page class.
+
+        Returns:
+            Sitemap page, or None if the page is incomplete or invalid.
+        """
+        try:
+            return current_page.page()
+        except Exception as ex:  # noqa: BLE001
+            log.warning(f"Skipping invalid page in sitemap from URL {self._url}: {ex}")
+            return None
+
     @abc.abstractmethod
     def sitemap(self: AbstractXMLSitemapParser) -> AbstractSitemap:
         """Return constructed sitemap.
@@ -496,15 +1056,20 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
 
     __slots__: list[str] = [
         "_web_client",
+        "_crawl_state",
         "_recursion_level",
         # List of sub-sitemap URLs found in this index sitemap
         "_sub_sitemap_urls",
+        # Set of the same URLs for constant time duplicate checks
+        "_sub_sitemap_urls_seen",
     ]
 
     def __init__(
         self: IndexXMLSitemapParser,
         url: str,
         recursion_level: int,
+        web_client: Client,
+        crawl_state: CrawlState,
     ) -> None:
         """Constructor.
 
@@ -513,11 +1078,15 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
             url: URL of the sitemap that is being parsed.
             web_client: Web client implementation to use for fetching sitemaps.
             recursion_level: Recursion level in iterating over sub-sitemaps.
+            crawl_state: State of the crawl that the sitemap is parsed as part of.
         """
         super().__init__(url=url)
 
         self._recursion_level: int = recursion_level
+        self._web_client: Client = web_client
+        self._crawl_state: CrawlState = crawl_state
         self._sub_sitemap_urls: list[str] = []
+        self._sub_sitemap_urls_seen: set[str] = set()
 
     def xml_element_end(self: IndexXMLSitemapParser, name: str) -> None:
         """Handler for XML element end.
@@ -530,7 +1099,8 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
             if not is_http_url(sub_sitemap_url):
                 log.warning(f"Sub-sitemap URL does not look like one: {sub_sitemap_url}")
 
-            elif sub_sitemap_url not in self._sub_sitemap_urls:
+            elif sub_sitemap_url not in self._sub_sitemap_urls_seen:
+                self._sub_sitemap_urls_seen.add(sub_sitemap_url)  # type: ignore # noqa: PGH003
                 self._sub_sitemap_urls.append(sub_sitemap_url)  # type: ignore # noqa: PGH003
 
         super().xml_element_end(name=name)
@@ -544,23 +1114,12 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
         Returns:
             Sitemap object.
         """
-        sub_sitemaps = []
-
-        for sub_sitemap_url in self._sub_sitemap_urls:
-            # URL might be invalid, or recursion limit might have been reached
-            try:
-                fetcher = SitemapFetcher(
-                    url=sub_sitemap_url,
-                    recursion_level=self._recursion_level + 1,
-                )
-                fetched_sitemap: AbstractSitemap = fetcher.sitemap()
-            except Exception as ex:  # noqa: BLE001
-                fetched_sitemap = InvalidSitemap(
-                    url=sub_sitemap_url,
-                    reason=f"Unable to add sub-sitemap from URL {sub_sitemap_url}: {ex!s}",
-                )
-
-            sub_sitemaps.append(fetched_sitemap)
+        sub_sitemaps: list[AbstractSitemap] = SitemapFetcher.sitemaps(
+            urls=self._sub_sitemap_urls,
+            recursion_level=self._recursion_level + 1,
+            web_client=self._web_client,
+            crawl_state=self._crawl_state,
+        )
 
         return IndexXMLSitemap(url=self._url, sub_sitemaps=sub_sitemaps)
 
@@ -613,6 +1172,49 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
             """
             return hash((self.url,))
 
+        def __news_story(self: PagesXMLSitemapParser.Page) -> SitemapNewsStory | None:
+            """Return constructed news story if the page has a news title and publish date, otherwise None."""
+            # Most sitemaps aren't Google News sitemaps, so don't bother with the rest of the news fields
+            if not (self.news_title and self.news_publish_date):
+                return None
+
+            news_title: str | None = html_unescape_strip(self.news_title)
+
+            news_publish_date = html_unescape_strip(self.news_publish_date)
+            if news_publish_date:
+                news_publish_date = parse_iso8601_date(date_string=news_publish_date)
+
+            if not (news_title and news_publish_date):
+                return None
+
+            news_publication_name: str | None = html_unescape_strip(
+                self.news_publication_name,
+            )
+            news_publication_language: str | None = html_unescape_strip(
+                self.news_publication_language,
+            )
+            news_access: str | None = html_unescape_strip(self.news_access)
+
+            news_genres = html_unescape_strip(self.news_genres)
+            news_genres = tuple(x.strip() for x in news_genres.split(",")) if news_genres else ()
+
+            news_keywords = html_unescape_strip(self.news_keywords)
+            news_keywords = tuple(x.strip() for x in news_keywords.split(",")) if news_keywords else ()
+
+            news_stock_tickers = html_unescape_strip(self.news_stock_tickers)
+            news_stock_tickers = tuple(x.strip() for x in news_stock_tickers.split(",")) if news_stock_tickers else ()
+
+            return SitemapNewsStory(
+                title=news_title,
+                publish_date=news_publish_date,
+                publication_name=news_publication_name,
+                publication_language=news_publication_language,
+                access=news_access,
+                genres=news_genres,
+                keywords=news_keywords,
+                stock_tickers=news_stock_tickers,
+            )
+
         def page(self: PagesXMLSitemapParser.Page) -> SitemapPage | None:
             """Return constructed sitemap page if one has been completed, otherwise None."""
             # Required
@@ -627,82 +1229,57 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
 
             change_frequency = html_unescape_strip(self.change_frequency)
             if change_frequency:
-                change_frequency = change_frequency.lower()
-                if SitemapPageChangeFrequency.has_value(change_frequency):
-                    change_frequency = SitemapPageChangeFrequency(change_frequency)
-                else:
+                change_frequency = _CHANGE_FREQUENCIES.get(change_frequency.lower())
+                if change_frequency is None:
                     log.warning("Invalid change frequency, defaulting to 'always'.")
                     change_frequency = SitemapPageChangeFrequency.ALWAYS
-                if isinstance(change_frequency, SitemapPageChangeFrequency):
-                    msg = "SitemapPageChangeFrequency"
-                    log.error(msg)
 
             priority = html_unescape_strip(self.priority)
             if priority:
-                priority = Decimal(priority)
-
-                comp_zero = priority.compare(Decimal("0.0"))
-                comp_one = priority.compare(Decimal("1.0"))
-                if comp_zero in {
-                    Decimal("0"),
-                    Decimal("1") and comp_one in {Decimal("0"), Decimal("-1")},
-                }:
-                    # 0 <= priority <= 1
-                    pass
+                cached_priority: Decimal | None = _PRIORITIES.get(priority)
+                if cached_priority is not None:
+                    priority = cached_priority
+
                 else:
-                    log.warning(f"Priority is not within 0 and 1: {priority}")
-                    priority = SITEMAP_PAGE_DEFAULT_PRIORITY
+                    priority = Decimal(priority)
+
+                    if priority.is_nan() or not _PRIORITY_MIN <= priority <= _PRIORITY_MAX:
+                        log.warning(f"Priority is not within 0 and 1: {priority}")
+                        priority = SITEMAP_PAGE_DEFAULT_PRIORITY
 
             else:
                 priority = SITEMAP_PAGE_DEFAULT_PRIORITY
 
-            news_title: str | None = html_unescape_strip(self.news_title)
-
-            news_publish_date = html_unescape_strip(self.news_publish_date)
-            if news_publish_date:
-                news_publish_date = parse_iso8601_date(date_string=news_publish_date)
-
-            news_publication_name: str | None = html_unescape_strip(
-                self.news_publication_name,
-            )
-            news_publication_language: str | None = html_unescape_strip(
-                self.news_publication_language,
-            )
-            news_access: str | None = html_unescape_strip(self.news_access)
-
-            news_genres = html_unescape_strip(self.news_genres)
-            news_genres = [x.strip() for x in news_genres.split(",")] if news_genres else []
-
-            news_keywords = html_unescape_strip(self.news_keywords)
-            news_keywords = [x.strip() for x in news_keywords.split(",")] if news_keywords else []
-
-            news_stock_tickers = html_unescape_strip(self.news_stock_tickers)
-            news_stock_tickers = [x.strip() for x in news_stock_tickers.split(",")] if news_stock_tickers else []
-
-            sitemap_news_story = None
-            if news_title and news_publish_date:
-                sitemap_news_story = SitemapNewsStory(
-                    title=news_title,
-                    publish_date=news_publish_date,
-                    publication_name=news_publication_name,
-                    publication_language=news_publication_language,
-                    access=news_access,
-                    genres=news_genres,
-                    keywords=news_keywords,
-                    stock_tickers=news_stock_tickers,
-                )
-
             return SitemapPage(
                 url=url,
                 last_modified=last_modified,  # type: ignore  # noqa: PGH003
                 change_frequency=change_frequency,  # type: ignore  # noqa: PGH003
                 priority=priority,
-                news_story=sitemap_news_story,
+                news_story=self.__news_story(),
             )
 
+    __PAGE_FIELDS: ClassVar[dict[str, tuple[str, bool]]] = {
+        # Every entry must have <loc>
+        "sitemap:loc": ("url", True),
+        # Element might be present but character data might be empty
+        "sitemap:lastmod": ("last_modified", False),
+        "sitemap:changefreq": ("change_frequency", False),
+        "sitemap:priority": ("priority", False),
+        "news:name": ("news_publication_name", False),  # news/publication/name
+        "news:language": ("news_publication_language", False),  # news/publication/language
+        "news:publication_date": ("news_publish_date", False),
+        # Every Google News sitemap entry must have <title>
+        "news:title": ("news_title", True),
+        "news:access": ("news_access", False),
+        "news:keywords": ("news_keywords", False),
+        "news:stock_tickers": ("news_stock_tickers", False),
+    }
+    """Page attribute to set at the end of each element, and whether the element must have character data."""
+
     __slots__: list[str] = [
         "_current_page",
         "_pages",
+        "_seen_urls",
     ]
 
     def __init__(self: PagesXMLSitemapParser, url: str) -> None:
@@ -714,7 +1291,8 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
         super().__init__(url=url)
 
         self._current_page = None
-        self._pages = []
+        self._pages: list[SitemapPage] = []
+        self._seen_urls: set[str | None] = set()
 
     def xml_element_start(
         self: PagesXMLSitemapParser,
@@ -741,24 +1319,7 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
                 )
             self._current_page = self.Page()
 
-    def __require_last_char_data_to_be_set(
-        self: PagesXMLSitemapParser,
-        name: str,
-    ) -> None:
-        """Raise exception if last character data is not set.
-
-        Args:
-            self: Pages XML sitemap parser.
-            name: XML element name.
-
-        Raises:
-            SitemapXMLParsingExceptionError: If the last character data is not set.
-        """
-        if not self._last_char_data:
-            msg: str = f"Character data is expected to be set at the end of <{name}>."
-            raise SitemapXMLParsingExceptionError(msg)
-
-    def xml_element_end(self: PagesXMLSitemapParser, name: str) -> None:  # noqa: C901, PLR0912
+    def xml_element_end(self: PagesXMLSitemapParser, name: str) -> None:
         """Handler for XML element end.
 
         Args:
@@ -773,56 +1334,22 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
             raise SitemapXMLParsingExceptionError(msg)
 
         if name == "sitemap:url":
-            if self._current_page not in self._pages:
-                self._pages.append(self._current_page)
+            if self._current_page.url not in self._seen_urls:  # type: ignore # noqa: PGH003
+                self._seen_urls.add(self._current_page.url)  # type: ignore # noqa: PGH003
+                # Build the page right away so that only one intermediate Page is alive at a time
+                page: SitemapPage | None = self._build_page(self._current_page)
+                if page:
+                    self._pages.append(page)
             self._current_page = None
 
-        else:  # noqa: PLR5501
-            if name == "sitemap:loc":
-                # Every entry must have <loc>
-                self.__require_last_char_data_to_be_set(name=name)
-                self._current_page.url = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "sitemap:lastmod":
-                # Element might be present but character data might be empty
-                self._current_page.last_modified = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "sitemap:changefreq":
-                # Element might be present but character data might be empty
-                self._current_page.change_frequency = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "sitemap:priority":
-                # Element might be present but character data might be empty
-                self._current_page.priority = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "news:name":  # news/publication/name
-                # Element might be present but character data might be empty
-                self._current_page.news_publication_name = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "news:language":  # news/publication/language
-                # Element might be present but character data might be empty
-                self._current_page.news_publication_language = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "news:publication_date":
-                # Element might be present but character data might be empty
-                self._current_page.news_publish_date = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "news:title":
-                # Every Google News sitemap entry must have <title>
-                self.__require_last_char_data_to_be_set(name=name)
-                self._current_page.news_title = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "news:access":
-                # Element might be present but character data might be empty
-                self._current_page.news_access = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "news:keywords":
-                # Element might be present but character data might be empty
-                self._current_page.news_keywords = self._last_char_data  # type: ignore  # noqa: PGH003
-
-            elif name == "news:stock_tickers":
-                # Element might be present but character data might be empty
-                self._current_page.news_stock_tickers = self._last_char_data  # type: ignore  # noqa: PGH003
+        else:
+            page_field: tuple[str, bool] | None = self.__PAGE_FIELDS.get(name)
+            if page_field:
+                attribute, is_required = page_field
+                last_char_data: str = self._last_char_data
+                if is_required and not last_char_data:
+                    raise _char_data_unset_error(name)
+                setattr(self._current_page, attribute, last_char_data)
 
         super().xml_element_end(name=name)
 
@@ -832,14 +1359,7 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
         Returns:
             Sitemap object.
         """
-        pages = []
-
-        for page_row in self._pages:
-            page = page_row.page()
-            if page:
-                pages.append(page)
-
-        return PagesXMLSitemap(url=self._url, pages=pages)
+        return PagesXMLSitemap(url=self._url, pages=self._pages)
 
 
 class PagesRSSSitemapParser(AbstractXMLSitemapParser):
@@ -911,9 +1431,21 @@ class PagesRSSSitemapParser(AbstractXMLSitemapParser):
                 ),
             )
 
+    __PAGE_FIELDS: ClassVar[dict[str, tuple[str, bool]]] = {
+        # Every entry must have <link>
+        "link": ("link", True),
+        # Title / description (if set) can't be empty
+        "title": ("title", True),
+        "description": ("description", True),
+        # Element might be present but character data might be empty
+        "pubDate": ("publication_date", False),
+    }
+    """Page attribute to set at the end of each element, and whether the element must have character data."""
+
     __slots__: list[str] = [
         "_current_page",
         "_pages",
+        "_seen_links",
     ]
 
     def __init__(self: PagesRSSSitemapParser, url: str) -> None:
@@ -925,7 +1457,8 @@ class PagesRSSSitemapParser(AbstractXMLSitemapParser):
         super().__init__(url=url)
 
         self._current_page = None
-        self._pages = []
+        self._pages: list[SitemapPage] = []
+        self._seen_links: set[str | None] = set()
 
     def xml_element_start(
         self: PagesRSSSitemapParser,
@@ -951,22 +1484,6 @@ class PagesRSSSitemapParser(AbstractXMLSitemapParser):
                 )
             self._current_page = self.Page()
 
-    def __require_last_char_data_to_be_set(
-        self: PagesRSSSitemapParser,
-        name: str,
-    ) -> None:
-        """Check that character data is set.
-
-        Args:
-            name: XML element name.
-
-        Raises:
-            SitemapXMLParsingException: If character data is not set.
-        """
-        if not self._last_char_data:
-            msg: str = f"Character data is expected to be set at the end of <{name}>."
-            raise SitemapXMLParsingExceptionError(msg)
-
     def xml_element_end(self: PagesRSSSitemapParser, name: str) -> None:
         """Handler for XML element end.
 
@@ -976,29 +1493,22 @@ class PagesRSSSitemapParser(AbstractXMLSitemapParser):
         # If within <item> already
         if self._current_page:
             if name == "item":
-                if self._current_page not in self._pages:
-                    self._pages.append(self._current_page)
+                if self._current_page.link not in self._seen_links:
+                    self._seen_links.add(self._current_page.link)
+                    # Build the page right away so that only one intermediate Page is alive at a time
+                    page: SitemapPage | None = self._build_page(self._current_page)
+                    if page:
+                        self._pages.append(page)
                 self._current_page = None
 
-            else:  # noqa: PLR5501
-                if name == "link":
-                    # Every entry must have <link>
-                    self.__require_last_char_data_to_be_set(name=name)
-                    self._current_page.link = self._last_char_data
-
-                elif name == "title":
-                    # Title (if set) can't be empty
-                    self.__require_last_char_data_to_be_set(name=name)
-                    self._current_page.title = self._last_char_data
-
-                elif name == "description":
-                    # Description (if set) can't be empty
-                    self.__require_last_char_data_to_be_set(name=name)
-                    self._current_page.description = self._last_char_data
-
-                elif name == "pubDate":
-                    # Element might be present but character data might be empty
-                    self._current_page.publication_date = self._last_char_data
+            else:
+                page_field: tuple[str, bool] | None = self.__PAGE_FIELDS.get(name)
+                if page_field:
+                    attribute, is_required = page_field
+                    last_char_data: str = self._last_char_data
+                    if is_required and not last_char_data:
+                        raise _char_data_unset_error(name)
+                    setattr(self._current_page, attribute, last_char_data)
 
         super().xml_element_end(name=name)
 
@@ -1008,14 +1518,7 @@ class PagesRSSSitemapParser(AbstractXMLSitemapParser):
         Returns:
             Sitemap object.
         """
-        pages = []
-
-        for page_row in self._pages:
-            page = page_row.page()
-            if page:
-                pages.append(page)
-
-        return PagesRSSSitemap(url=self._url, pages=pages)
+        return PagesRSSSitemap(url=self._url, pages=self._pages)
 
 
 class PagesAtomSitemapParser(AbstractXMLSitemapParser):
@@ -1082,9 +1585,21 @@ class PagesAtomSitemapParser(AbstractXMLSitemapParser):
                 ),
             )
 
+    __PAGE_FIELDS: ClassVar[dict[str, tuple[str, bool]]] = {
+        # Title / description (if set) can't be empty
+        "title": ("title", True),
+        "tagline": ("description", True),
+        "summary": ("description", True),
+        # Element might be present but character data might be empty
+        "issued": ("publication_date", False),
+        "published": ("publication_date", False),
+    }
+    """Page attribute to set at the end of each element, and whether the element must have character data."""
+
     __slots__: list[str] = [
         "_current_page",
         "_pages",
+        "_seen_links",
         "_last_link_rel_self_href",
     ]
 
@@ -1097,7 +1612,8 @@ class PagesAtomSitemapParser(AbstractXMLSitemapParser):
         super().__init__(url=url)
 
         self._current_page = None
-        self._pages = []
+        self._pages: list[SitemapPage] = []
+        self._seen_links: set[str] = set()
         self._last_link_rel_self_href = None
 
     def xml_element_start(
@@ -1131,14 +1647,6 @@ class PagesAtomSitemapParser(AbstractXMLSitemapParser):
             ):
                 self._last_link_rel_self_href: str | None = attrs.get("href")
 
-    def __require_last_char_data_to_be_set(
-        self: PagesAtomSitemapParser,
-        name: str,
-    ) -> None:
-        if not self._last_char_data:
-            msg: str = f"Character data is expected to be set at the end of <{name}>."
-            raise SitemapXMLParsingExceptionError(msg)
-
     def xml_element_end(self: PagesAtomSitemapParser, name: str) -> None:
         """Handler for XML element end.
 
@@ -1153,30 +1661,28 @@ class PagesAtomSitemapParser(AbstractXMLSitemapParser):
                     self._current_page.link = self._last_link_rel_self_href
                     self._last_link_rel_self_href = None
 
-                    if self._current_page not in self._pages:
-                        self._pages.append(self._current_page)
+                    if self._current_page.link not in self._seen_links:
+                        self._seen_links.add(self._current_page.link)
+                        # Build the page right away so that only one intermediate Page is alive at a time
+                        page: SitemapPage | None = self._build_page(self._current_page)
+                        if page:
+                            self._pages.append(page)
 
                 self._current_page = None
 
-            else:  # noqa: PLR5501
-                if name == "title":
-                    # Title (if set) can't be empty
-                    self.__require_last_char_data_to_be_set(name=name)
-                    self._current_page.title = self._last_char_data
-
-                elif name in {"tagline", "summary"}:
-                    # Description (if set) can't be empty
-                    self.__require_last_char_data_to_be_set(name=name)
-                    self._current_page.description = self._last_char_data
-
-                elif name in {"issued", "published"}:
-                    # Element might be present but character data might be empty
+            elif name == "updated":
+                # No 'issued' or 'published' were set before
+                if not self._current_page.publication_date:
                     self._current_page.publication_date = self._last_char_data  # type: ignore  # noqa: PGH003
 
-                elif name == "updated":
-                    # No 'issued' or 'published' were set before
-                    if not self._current_page.publication_date:
-                        self._current_page.publication_date = self._last_char_data  # type: ignore  # noqa: PGH003
+            else:
+                page_field: tuple[str, bool] | None = self.__PAGE_FIELDS.get(name)
+                if page_field:
+                    attribute, is_required = page_field
+                    last_char_data: str = self._last_char_data
+                    if is_required and not last_char_data:
+                        raise _char_data_unset_error(name)
+                    setattr(self._current_page, attribute, last_char_data)
 
         super().xml_element_end(name=name)
 
@@ -1186,11 +1692,4 @@ class PagesAtomSitemapParser(AbstractXMLSitemapParser):
         Returns:
             Sitemap object.
         """
-        pages = []
-
-        for page_row in self._pages:
-            page = page_row.page()
-            if page:
-                pages.append(page)
-
-        return PagesAtomSitemap(url=self._url, pages=pages)
+        return PagesAtomSitemap(url=self._url, pages=self._pages)
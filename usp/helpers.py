@@ -3,11 +3,17 @@
 
 from __future__ import annotations
 
-import gzip as gzip_lib
+import datetime
+import email.utils
 import html
+import io
+import os
 import re
+from functools import lru_cache
+from html.entities import html5 as html5_entities
+from operator import itemgetter
 from typing import TYPE_CHECKING
-from urllib.parse import ParseResult, unquote_plus, urlparse, urlunparse
+from urllib.parse import SplitResult, unquote_plus, urlsplit
 
 from dateutil.parser import parse as dateutil_parse
 from loguru import logger as log
@@ -15,20 +21,117 @@ from loguru import logger as log
 from .exceptions import (
     GunzipExceptionError,
     SitemapExceptionError,
+    StripURLToHomepageExceptionError,
 )
 
-if TYPE_CHECKING:
-    import datetime
+# Use the much faster ISA-L or zlib-ng inflate implementations if either is installed; isal_zlib and zlib_ng are
+# drop-in replacements for zlib.
+try:
+    from isal import isal_zlib as zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as zlib
+    except ImportError:
+        import zlib
+
+# ciso8601 parses the less common ISO 8601 layouts in C if it's installed, before falling back to dateutil.
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+# rapidgzip decompresses large archives with multiple threads if it's installed.
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
 
+if TYPE_CHECKING:
     from httpx import Response
 
-# Regular expression to match HTTP(s) URLs.
-__URL_REGEX: re.Pattern[str] = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
+# Regular expression to match the part of HTTP(s) URLs after "http://" or "https://".
+__URL_AFTER_SCHEME_REGEX: re.Pattern[str] = re.compile(r"[^\s/$.?#].[^\s]*$")
+
+# Matches "gzip" anywhere in a Content-Type header, e.g. "application/x-gzip", regardless of case.
+_GZIP_CONTENT_TYPE_REGEX: re.Pattern[str] = re.compile(r"gzip", re.IGNORECASE)
+
+# Lowercase prefixes of HTTP(s) URLs.
+_HTTP_URL_PREFIXES: tuple[str, str] = ("http://", "https://")
+
+# Longest named character reference (including the terminating semicolon), e.g. "CounterClockwiseContourIntegral;"
+_MAX_HTML_ENTITY_LENGTH: int = max(len(name) for name in html5_entities)
+
+# The most common named entities, with "&amp;" last so that e.g. "&amp;lt;" doesn't get unescaped twice.
+_HTML_COMMON_ENTITIES: tuple[tuple[str, str], ...] = (
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+    ("&apos;", "'"),
+    ("&amp;", "&"),
+)
+
+# Characters after "&" which make html.unescape() leave the ampersand as-is.
+_HTML_LITERAL_AMPERSAND_FOLLOWERS: frozenset[str] = frozenset("\t\n\f <&;")
+
+# Month abbreviations used in RFC 2822 dates.
+_RFC2822_MONTHS: dict[str, int] = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+# zlib window bits value for decompressing data with a gzip header and trailer.
+_GZIP_WBITS: int = zlib.MAX_WBITS | 16
 
+# Amount of compressed data to feed to the decompressor at a time.
+_GUNZIP_CHUNK_SIZE: int = 64 * 1024
 
-def is_http_url(url: str | None) -> bool:  # noqa: PLR0911
+# Gzipped data smaller than this is not worth spinning up rapidgzip's thread pool for.
+_GUNZIP_PARALLEL_MIN_SIZE: int = 4 * 1024 * 1024
+
+# Separators in "Tue, 10 Aug 2010 20:43:53 -0000", and a getter for the positions they're expected at.
+_RFC2822_SEPARATORS: tuple[str, ...] = (",", " ", " ", " ", " ", ":", ":", " ")
+_rfc2822_separators = itemgetter(3, 4, 7, 11, 16, 19, 22, 25)
+
+# Day, year, hour, minute and second fields in "Tue, 10 Aug 2010 20:43:53 -0000".
+_rfc2822_digit_fields = itemgetter(slice(5, 7), slice(12, 16), slice(17, 19), slice(20, 22), slice(23, 25))
+
+# RFC 2822 time zone names that mean UTC.
+_RFC2822_UTC_ZONES: frozenset[str] = frozenset({"GMT", "UT", "UTC", "Z"})
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlsplit(url: str) -> SplitResult:
+    """Split URL into its components, caching the result.
+
+    The same URLs get split over and over again while crawling (validation, gzip detection,
+    homepage stripping), and urlsplit()'s own cache is too small to be of much help.
+
+    Args:
+        url: URL to split.
+
+    Returns:
+        Split URL.
+    """
+    return urlsplit(url)
+
+
+@lru_cache(maxsize=65536)
+def is_http_url(url: str | None) -> bool:
     """Returns true if URL is of the "http" ("https") scheme.
 
+    Results are cached as the same sitemap URLs get checked again and again while crawling, e.g. when they are listed
+    in both robots.txt and an index sitemap.
+
     :param url: URL to test.
     :return: True if argument URL is of the "http" ("https") scheme.
     """
@@ -36,34 +139,149 @@ def is_http_url(url: str | None) -> bool:  # noqa: PLR0911
         log.debug("URL is None or empty")
         return False
 
-    log.debug(f"Testing if URL '{url}' is HTTP(s) URL")
+    # Arguments are passed to the logger instead of formatting f-strings, so that loguru only formats the messages if
+    # debug logging is actually enabled
+    log.debug("Testing if URL '{}' is HTTP(s) URL", url)
+
+    # Check the scheme with plain prefix comparisons and leave only the rest of the URL to the regex; most URLs have
+    # a lowercase scheme already, so only lowercase the start of the URL if they don't
+    url_start: str = url if url.startswith(_HTTP_URL_PREFIXES) else url[:8].lower()
+    if not url_start.startswith(_HTTP_URL_PREFIXES):
+        log.debug("URL '{}' is not of the HTTP(s) scheme", url)
+        return False
+
+    # "http://" has the colon right after "http", "https://" has an "s" there
+    scheme_length: int = 7 if url_start[4] == ":" else 8
 
-    if not re.search(__URL_REGEX, url):
-        log.debug(f"URL '{url}' does not match URL's regexp")
+    if not __URL_AFTER_SCHEME_REGEX.match(url, scheme_length):
+        log.debug("URL '{}' does not match URL's regexp", url)
         return False
 
     try:
         # Try parsing the URL
-        uri: ParseResult = urlparse(url)
-        _: str = urlunparse(uri)
+        uri: SplitResult = _cached_urlsplit(url)
 
     except Exception as ex:  # noqa: BLE001
-        log.debug(f"Cannot parse URL {url}: {ex}")
+        log.debug("Cannot parse URL {}: {}", url, ex)
         return False
 
-    if not uri.scheme:
-        log.debug(f"Scheme is undefined for URL {url}.")
-        return False
-    if uri.scheme.lower() not in {"http", "https"}:
-        log.debug(f"Scheme is not HTTP(s) for URL {url}.")
-        return False
+    # Scheme has been checked already, so only the host is left
     if not uri.hostname:
-        log.debug(f"Host is undefined for URL {url}.")
+        log.debug("Host is undefined for URL {}.", url)
         return False
 
     return True
 
 
+def strip_url_to_homepage(url: str) -> str:
+    """Strip URL to its homepage.
+
+    Args:
+        url: URL to strip, e.g. "http://www.example.com/page.html".
+
+    Raises:
+        StripURLToHomepageExceptionError: If the URL is empty or not a HTTP(s) URL.
+
+    Returns:
+        Stripped homepage URL, e.g. "http://www.example.com/".
+    """
+    if not url:
+        msg = "URL is empty."
+        raise StripURLToHomepageExceptionError(msg)
+
+    try:
+        uri: SplitResult = _cached_urlsplit(url)
+    except ValueError as ex:
+        msg = f"Unable to parse URL {url}: {ex}"
+        raise StripURLToHomepageExceptionError(msg) from ex
+
+    if uri.scheme.lower() not in {"http", "https"}:
+        msg = f"Scheme must be http:// or https:// for URL {url}"
+        raise StripURLToHomepageExceptionError(msg)
+
+    return f"{uri.scheme}://{uri.netloc}/"
+
+
+def _html_unescape_common(string: str) -> str | None:
+    """Unescape strings in which every "&" starts one of the most common named entities, e.g. "&amp;" in URLs.
+
+    Args:
+        string: String with at least one "&" in it.
+
+    Returns:
+        Unescaped string, or None if the string has other references (or literal ampersands) in it.
+    """
+    if string.count("&") != sum(string.count(entity) for entity, _ in _HTML_COMMON_ENTITIES):
+        return None
+
+    for entity, replacement in _HTML_COMMON_ENTITIES:
+        string = string.replace(entity, replacement)
+
+    return string
+
+
+def _html_unescape_fast(string: str) -> str:
+    """Unescape HTML entities in a single forward pass.
+
+    Only semicolon-terminated references are decoded here. Anything else (references without a
+    semicolon, unknown names, code points that need special handling) makes the whole string go
+    through html.unescape() instead so that the result always matches the standard library.
+
+    Args:
+        string: String with at least one "&" in it.
+
+    Returns:
+        Unescaped string.
+    """
+    chunks: list[str] = []
+    start: int = 0
+    ampersand: int = string.find("&")
+
+    while ampersand != -1:
+        reference_start: int = ampersand + 1
+        if reference_start == len(string) or string[reference_start] in _HTML_LITERAL_AMPERSAND_FOLLOWERS:
+            # Not a character reference, e.g. "Tom & Jerry"
+            ampersand = string.find("&", reference_start)
+            continue
+
+        semicolon: int = string.find(";", reference_start, reference_start + _MAX_HTML_ENTITY_LENGTH)
+        if semicolon == -1:
+            return html.unescape(string)
+
+        reference_end: int = semicolon + 1
+        reference: str = string[reference_start:reference_end]
+        if reference[0] == "#":
+            if reference[1:2] in {"x", "X"}:
+                digits, base = reference[2:-1], 16
+            else:
+                digits, base = reference[1:-1], 10
+
+            if not (digits.isascii() and digits.isalnum()):
+                return html.unescape(string)
+            try:
+                code_point: int = int(digits, base)
+            except ValueError:
+                return html.unescape(string)
+
+            # Control characters, surrogates etc. get replaced by html.unescape() in various ways
+            if not (0x20 <= code_point < 0x7F or 0xA0 <= code_point < 0xD800):  # noqa: PLR2004
+                return html.unescape(string)
+            replacement: str = chr(code_point)
+
+        else:
+            named_replacement: str | None = html5_entities.get(reference)
+            if named_replacement is None:
+                return html.unescape(string)
+            replacement = named_replacement
+
+        chunks.extend((string[start:ampersand], replacement))
+        start = reference_end
+        ampersand = string.find("&", start)
+
+    chunks.append(string[start:])
+    return "".join(chunks)
+
+
 def html_unescape_strip(string: str | None) -> str | None:
     """Unescape HTML entities and strip string.
 
@@ -74,14 +292,86 @@ def html_unescape_strip(string: str | None) -> str | None:
         Unescaped and stripped string.
     """
     if string:
-        string = html.unescape(string)
-        string = string.strip() or None
+        # Strip first so that the rest only deals with the (usually shorter) actual value
+        string = string.strip()
+        if "&" in string:
+            unescaped_string: str | None = _html_unescape_common(string)
+            string = _html_unescape_fast(string) if unescaped_string is None else unescaped_string
+            # Entities such as "&nbsp;" might have been whitespace
+            string = string.strip()
+        string = string or None
     return string
 
 
+def _parse_utc_offset(offset: str) -> datetime.timezone:
+    """Parse UTC offset, e.g. "+02:00", "-0500" or "Z", into a time zone.
+
+    Args:
+        offset: UTC offset.
+
+    Raises:
+        ValueError: If the UTC offset is not in one of the supported formats.
+
+    Returns:
+        Time zone with the offset.
+    """
+    if offset in {"Z", "z"}:
+        return datetime.UTC
+
+    if offset[:1] not in {"+", "-"} or len(offset) not in {5, 6}:
+        msg = f"Unsupported UTC offset '{offset}'."
+        raise ValueError(msg)
+
+    hours: int = int(offset[1:3])
+    minutes: int = int(offset[-2:])
+    if len(offset) == 6 and offset[3] != ":":  # noqa: PLR2004
+        msg = f"Unsupported UTC offset '{offset}'."
+        raise ValueError(msg)
+
+    if not (hours or minutes):
+        return datetime.UTC
+
+    delta = datetime.timedelta(hours=hours, minutes=minutes)
+    return datetime.timezone(-delta if offset[0] == "-" else delta)
+
+
+def _parse_iso8601_date_fast(date_string: str) -> datetime.datetime:
+    """Parse the common "YYYY-MM-DD[THH:MM:SS[.ffffff][Z|+HH:MM]]" dates without a generic parser.
+
+    The layout is checked here and the actual parsing is left to the C implementation of
+    datetime.fromisoformat(); other ISO 8601 flavors that it accepts (week dates, basic format,
+    etc.) are left for dateutil to keep their interpretation unchanged.
+
+    Args:
+        date_string: ISO 8601 date.
+
+    Raises:
+        ValueError: If the date is not in one of the supported formats.
+
+    Returns:
+        Datetime object of a parsed date.
+    """
+    length: int = len(date_string)
+    if length < 10 or date_string[4] != "-" or date_string[7] != "-":  # noqa: PLR2004
+        msg = f"Unsupported ISO 8601 date '{date_string}'."
+        raise ValueError(msg)
+
+    if length > 10 and (  # noqa: PLR2004
+        length < 19 or date_string[10] not in {"T", " "} or date_string[13] != ":" or date_string[16] != ":"  # noqa: PLR2004
+    ):
+        msg = f"Unsupported ISO 8601 date '{date_string}'."
+        raise ValueError(msg)
+
+    return datetime.datetime.fromisoformat(date_string)
+
+
+@lru_cache(maxsize=4096)
 def parse_iso8601_date(date_string: str) -> datetime.datetime:
     """Parse ISO 8601 date (e.g. from Atom's <updated>) into datetime.datetime object.
 
+    Sitemaps tend to repeat the same few dates over and over again (e.g. after regenerating all of them at
+    once), so parsed dates are cached; datetime objects are immutable and safe to share between pages.
+
     Args:
         date_string: ISO 8601 date, e.g. "2010-08-10T20:43:53Z".
 
@@ -91,22 +381,94 @@ def parse_iso8601_date(date_string: str) -> datetime.datetime:
     Returns:
         Datetime object of a parsed date.
     """
-    # TODO: parse known date formats faster
-
     if not date_string:
         msg = "Date string is unset."
         raise SitemapExceptionError(msg)
 
+    try:
+        return _parse_iso8601_date_fast(date_string)
+    except ValueError:
+        # Not one of the common formats
+        pass
+
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(date_string)
+        except ValueError:
+            # Not ISO 8601 at all
+            pass
+
+    # Let dateutil figure it out
     return dateutil_parse(date_string)
 
 
+def _parse_rfc2822_date_fast(date_string: str) -> datetime.datetime:
+    """Parse the common "Tue, 10 Aug 2010 20:43:53 -0000" dates without a generic parser.
+
+    Args:
+        date_string: RFC 2822 date.
+
+    Raises:
+        ValueError: If the date is not in the supported format.
+
+    Returns:
+        Datetime object of a parsed date.
+    """
+    if len(date_string) < 29 or _rfc2822_separators(date_string) != _RFC2822_SEPARATORS:  # noqa: PLR2004
+        msg = f"Unsupported RFC 2822 date '{date_string}'."
+        raise ValueError(msg)
+
+    month: int | None = _RFC2822_MONTHS.get(date_string[8:11])
+    if month is None:
+        msg = f"Unsupported month in RFC 2822 date '{date_string}'."
+        raise ValueError(msg)
+
+    # Validate all the numeric fields at once and convert them with a single int() call; int() on its own would
+    # also accept whitespace, signs, underscores and non-ASCII digits in each of the fields
+    digits: str = "".join(_rfc2822_digit_fields(date_string))
+    if not (digits.isascii() and digits.isdigit()):
+        msg = f"Unsupported RFC 2822 date '{date_string}'."
+        raise ValueError(msg)
+
+    # DDYYYYHHMMSS
+    number: int = int(digits)
+    number, second = divmod(number, 100)
+    number, minute = divmod(number, 100)
+    number, hour = divmod(number, 100)
+    day, year = divmod(number, 10000)
+
+    zone: str = date_string[26:]
+    tzinfo: datetime.timezone = datetime.UTC if zone in _RFC2822_UTC_ZONES else _parse_utc_offset(zone)
+
+    return datetime.datetime(year, month, day, hour, minute, second, tzinfo=tzinfo)
+
+
+@lru_cache(maxsize=4096)
 def parse_rfc2822_date(date_string: str) -> datetime.datetime:
     """Parse RFC 2822 date (e.g. from Atom's <issued>) into datetime.datetime object.
 
+    Parsed dates are cached the same way as in parse_iso8601_date().
+
     :param date_string: RFC 2822 date, e.g. "Tue, 10 Aug 2010 20:43:53 -0000".
     :return: datetime.datetime object of a parsed date.
     """
-    # TODO: parse known date formats faster
+    if date_string:
+        try:
+            return _parse_rfc2822_date_fast(date_string)
+        except ValueError:
+            # Not the common format
+            pass
+
+        # Standard library's RFC 2822 parser copes with the rest of the RFC 2822 variants (named time zones, two digit
+        # years, missing day of the week etc.); dates without a known time zone are left to the generic parser
+        try:
+            parsed_date: datetime.datetime = email.utils.parsedate_to_datetime(date_string)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if parsed_date.tzinfo is not None:
+                return parsed_date
+
     return parse_iso8601_date(date_string)
 
 
@@ -117,55 +479,121 @@ def __response_is_gzipped_data(url: str, response: Response) -> bool:
     :param response: Response object.
     :return: True if response looks like it might contain gzipped data.
     """
-    uri: ParseResult = urlparse(url)
-    url_path: str = unquote_plus(uri.path)
+    url_path: str = _cached_urlsplit(url).path
+    if "%" in url_path:
+        # Extension might be percent-encoded, e.g. "sitemap%2Egz"
+        url_path = unquote_plus(url_path)
+
+    # Lowercase just the extension and search the header case-insensitively instead of lowercasing both of them
+    if url_path[-3:].lower() == ".gz":
+        return True
+
     content_type: str = response.headers.get("Content-Type", "")
+    return _GZIP_CONTENT_TYPE_REGEX.search(content_type) is not None
+
 
-    return bool(url_path.lower().endswith(".gz") or "gzip" in content_type.lower())
+def _gunzip_chunked(data: bytes | bytearray | memoryview) -> bytes:
+    """Gunzip data by feeding it to a decompressor chunk by chunk.
 
+    Compressed data is sliced through a memoryview so it never gets copied, and the output is
+    accumulated in a single bytearray. Concatenated gzip members and zero padding after the
+    last member are handled the same way as gzip.decompress() does.
 
-def gunzip(data: bytes) -> bytes:
+    Args:
+        data: Gzipped data.
+
+    Raises:
+        EOFError: If the gzip stream ended before the end of the last member.
+        zlib.error: If the data is not a valid gzip stream.
+
+    Returns:
+        Gunzipped data.
+    """
+    gunzipped_data = bytearray()
+    decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+
+    with memoryview(data).cast("B") as view:
+        for start in range(0, len(view), _GUNZIP_CHUNK_SIZE):
+            end: int = start + _GUNZIP_CHUNK_SIZE
+            chunk: bytes | memoryview = view[start:end]
+
+            while chunk:
+                if decompressor.eof:
+                    # Zero padding or the start of the next gzip member
+                    chunk = bytes(chunk).lstrip(b"\x00")
+                    if not chunk:
+                        break
+                    decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+
+                gunzipped_data += decompressor.decompress(chunk)
+                chunk = decompressor.unused_data if decompressor.eof else b""
+
+    if not decompressor.eof:
+        msg = "Compressed file ended before the end-of-stream marker was reached."
+        raise EOFError(msg)
+
+    return bytes(gunzipped_data)
+
+
+def _gunzip_parallel(data: bytes | bytearray | memoryview, threads: int | None = None) -> bytes | None:
+    """Gunzip data with rapidgzip, using multiple threads.
+
+    rapidgzip is stricter than gzip.decompress() about what it accepts (e.g. it refuses zero
+    padding after the last member), so data it fails on returns None and is left to
+    _gunzip_chunked() to either decompress or report.
+
+    Args:
+        data: Gzipped data.
+        threads: Number of threads to use, defaults to the number of CPUs.
+
+    Returns:
+        Gunzipped data, or None if rapidgzip couldn't decompress it.
+    """
+    try:
+        with rapidgzip.RapidgzipFile(io.BytesIO(data), parallelization=threads or os.cpu_count() or 1) as file:
+            return file.read()
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def gunzip(data: bytes | bytearray | memoryview) -> bytes:
     """Gunzip data.
 
+    Buffers are decompressed in place, so a memoryview of a larger buffer doesn't get copied.
+
     :param data: Gzipped data.
     :return: Gunzipped data.
     """
-    if data is None:
-        msg = "Data is None."
-        raise GunzipExceptionError(msg)
-
-    if not isinstance(data, bytes):
+    if not isinstance(data, bytes | bytearray | memoryview):
         raise GunzipExceptionError("Data is not bytes: %s" % str(data))
 
-    if len(data) == 0:
+    if not data:
         msg = "Data is empty (no way an empty string is a valid Gzip archive)."
         raise GunzipExceptionError(msg)
 
     try:
-        gunzipped_data = gzip_lib.decompress(data)
+        gunzipped_data: bytes | None = None
+        if rapidgzip is not None and len(data) > _GUNZIP_PARALLEL_MIN_SIZE:
+            gunzipped_data = _gunzip_parallel(data)
+
+        if gunzipped_data is None:
+            gunzipped_data = _gunzip_chunked(data)
     except Exception as ex:  # noqa: BLE001
         msg: str = f"Unable to gunzip data: {ex}"
         raise GunzipExceptionError(msg) from ex
 
-    if gunzipped_data is None:
-        msg = "Gunzipped data is None."
-        raise GunzipExceptionError(msg)
-
-    if not isinstance(gunzipped_data, bytes):
-        msg = "Gunzipped data is not bytes."
-        raise GunzipExceptionError(msg)
-
     return gunzipped_data
 
 
-def ungzipped_response_content(url: str, response: Response) -> str:
-    """Return HTTP response's decoded content, gunzip it if necessary.
+def ungzipped_response_bytes(url: str, response: Response, content: bytes | None = None) -> bytes:
+    """Return HTTP response's raw content, gunzip it if necessary.
 
     :param url: URL the response was fetched from.
     :param response: Response object.
-    :return: Decoded and (if necessary) gunzipped response string.
+    :param content: Already read response content (e.g. from a streamed response), defaults to response.content.
+    :return: Undecoded and (if necessary) gunzipped response data.
     """
-    data = response.content
+    data = response.content if content is None else content
 
     if __response_is_gzipped_data(url=url, response=response):
         try:
@@ -175,11 +603,18 @@ def ungzipped_response_content(url: str, response: Response) -> str:
             msg: str = f"Unable to gunzip response {response}, maybe it's a non-gzipped sitemap: {ex}"
             log.error(msg)
 
-    # TODO: other encodings
-    data = data.decode("utf-8-sig", errors="replace")
+    return data
 
-    if isinstance(data, str):
-        msg = "Decoded data is not bytes."
-        log.error(msg)
 
-    return data
+def ungzipped_response_content(url: str, response: Response, content: bytes | None = None) -> str:
+    """Return HTTP response's decoded content, gunzip it if necessary.
+
+    :param url: URL the response was fetched from.
+    :param response: Response object.
+    :param content: Already read response content (e.g. from a streamed response), defaults to response.content.
+    :return: Decoded and (if necessary) gunzipped response string.
+    """
+    data = ungzipped_response_bytes(url=url, response=response, content=content)
+
+    # TODO: other encodings
+    return data.decode("utf-8-sig", errors="replace")
@@ -1,29 +1,55 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from operator import itemgetter
 
 import httpx
-from fake_useragent import UserAgent
 
 
 @lru_cache(maxsize=1)
 def get_useragent() -> str:
     """Return the most popular user agent string.
 
-    Cached so that we don't have to fetch it every time as it will always be the same.
+    Cached so that we don't have to fetch it every time as it will always be the same. fake_useragent is imported
+    only here as loading its browser data is slow, and not every user of this module ends up making requests.
 
     Returns:
         Most popular user agent string.
     """
+    from fake_useragent import UserAgent
+
     ua = UserAgent()
-    all_browsers: list[dict[str, float | str | int]] = ua.data_browsers
-    all_browsers.sort(key=lambda x: x["percent"], reverse=True)
-    most_popular_browser: dict[str, float | str | int] = all_browsers[0]
+    # Pick the most popular browser without sorting (and thereby modifying) fake_useragent's own list of browsers
+    most_popular_browser: dict[str, float | str | int] = max(ua.data_browsers, key=itemgetter("percent"))
 
     most_popular_useragent: str = str(most_popular_browser["useragent"])
     return most_popular_useragent
 
 
+def read_response_data(response: httpx.Response, max_length: int, chunk_size: int = 64 * 1024) -> bytes:
+    """Read a streamed response's content, stopping after max_length bytes.
+
+    The rest of the response is never downloaded; the connection gets closed once the streaming
+    context is exited.
+
+    Args:
+        response: Streamed response, e.g. from httpx.stream().
+        max_length: Max. number of bytes to read.
+        chunk_size: Number of bytes to read at a time.
+
+    Returns:
+        Response content, truncated to max_length bytes.
+    """
+    data = bytearray()
+    for chunk in response.iter_bytes(chunk_size=chunk_size):
+        data += chunk
+        if len(data) >= max_length:
+            del data[max_length:]
+            break
+
+    return bytes(data)
+
+
 def get_http_client() -> httpx.Client:
     """Return a HTTP client object.
 
@@ -33,4 +59,7 @@ def get_http_client() -> httpx.Client:
         headers={"User-Agent": get_useragent()},
         timeout=10,
         http2=True,
+        # Keep enough connections alive for all the threads of a crawl; max_connections has to be passed as well as it
+        # would be unlimited otherwise, unlike in httpx's default limits
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
     )
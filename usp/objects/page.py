@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Self
 
 if TYPE_CHECKING:
     import datetime
+    from collections.abc import Iterable
 
 # Default sitemap page priority, as per the spec.
 SITEMAP_PAGE_DEFAULT_PRIORITY = Decimal("0.5")
@@ -24,6 +25,8 @@ class SitemapNewsStory:
         "__genres",
         "__keywords",
         "__stock_tickers",
+        # Hash of the story, computed when it's first needed
+        "__hash",
     ]
 
     def __init__(  # noqa: PLR0913
@@ -33,9 +36,9 @@ class SitemapNewsStory:
         publication_name: str | None = None,
         publication_language: str | None = None,
         access: str | None = None,
-        genres: list[str] | None = None,
-        keywords: list[str] | None = None,
-        stock_tickers: list[str] | None = None,
+        genres: Iterable[str] | None = None,
+        keywords: Iterable[str] | None = None,
+        stock_tickers: Iterable[str] | None = None,
     ) -> None:
         """Initialize a new Google News story.
 
@@ -59,79 +62,104 @@ class SitemapNewsStory:
         self.__publication_name: str | None = publication_name
         self.__publication_language: str | None = publication_language
         self.__access: str | None = access
-        self.__genres: list[str] = genres or []
-        self.__keywords: list[str] = keywords or []
-        self.__stock_tickers: list[str] = stock_tickers or []
+        # Tuples rather than lists as stories are immutable (and hashable)
+        self.__genres: tuple[str, ...] = tuple(genres) if genres else ()
+        self.__keywords: tuple[str, ...] = tuple(keywords) if keywords else ()
+        self.__stock_tickers: tuple[str, ...] = tuple(stock_tickers) if stock_tickers else ()
+        self.__hash: int | None = None
 
-    def __eq__(self: SitemapNewsStory, other: SitemapNewsStory) -> bool:  # noqa: PLR0911
+    def __eq__(self: SitemapNewsStory, other: SitemapNewsStory) -> bool:
         """Return True if Google News stories are equal.
 
         Args:
             self: Single story derived from Google News XML sitemap.
             other: Single story derived from Google News XML sitemap.
 
-        Raises:
-            NotImplementedError: If other is not a SitemapNewsStory.
-
         Returns:
-            True if Google News stories are equal.
+            True if Google News stories are equal, or NotImplemented if the other object is not a SitemapNewsStory.
         """
-        if not isinstance(other, SitemapNewsStory):
-            raise NotImplementedError
-
-        if self.title != other.title:
-            return False
-
-        if self.publish_date != other.publish_date:
-            return False
+        if self is other:
+            return True
 
-        if self.publication_name != other.publication_name:
-            return False
-
-        if self.publication_language != other.publication_language:
-            return False
+        if not isinstance(other, SitemapNewsStory):
+            return NotImplemented
 
-        if self.access != other.access:
-            return False
+        # Compare all fields at once, which compares them one by one in C and stops at the first difference
+        return (
+            self.__title,
+            self.__publish_date,
+            self.__publication_name,
+            self.__publication_language,
+            self.__access,
+            self.__genres,
+            self.__keywords,
+            self.__stock_tickers,
+        ) == (
+            other.__title,
+            other.__publish_date,
+            other.__publication_name,
+            other.__publication_language,
+            other.__access,
+            other.__genres,
+            other.__keywords,
+            other.__stock_tickers,
+        )
 
-        if self.genres != other.genres:
-            return False
+    def __hash__(self: SitemapNewsStory) -> int:
+        """Return hash of the object.
 
-        if self.keywords != other.keywords:
-            return False
+        Stories don't change after they've been created, so the hash is computed only once.
+        """
+        if self.__hash is None:
+            self.__hash = hash(
+                (
+                    self.__title,
+                    self.__publish_date,
+                    self.__publication_name,
+                    self.__publication_language,
+                    self.__access,
+                    self.__genres,
+                    self.__keywords,
+                    self.__stock_tickers,
+                ),
+            )
+        return self.__hash
+
+    def __getstate__(self: SitemapNewsStory) -> tuple[None, dict[str, object]]:
+        """Return state of the object for pickling.
+
+        Cached hash is left out as string hashes differ between processes.
 
-        if self.stock_tickers != other.stock_tickers:
-            return False
+        Returns:
+            State of the object.
+        """
+        state: tuple[None, dict[str, object]] = super().__getstate__()  # type: ignore  # noqa: PGH003
+        state[1].pop("_SitemapNewsStory__hash", None)
+        return state
 
-        return True
+    def __setstate__(self: SitemapNewsStory, state: tuple[None, dict[str, object]]) -> None:
+        """Restore state of the object after unpickling.
 
-    def __hash__(self: SitemapNewsStory) -> int:
-        """Return hash of the object."""
-        return hash(
-            (
-                self.title,
-                self.publish_date,
-                self.publication_name,
-                self.publication_language,
-                self.access,
-                self.genres,
-                self.keywords,
-                self.stock_tickers,
-            ),
-        )
+        Args:
+            self: Single story derived from Google News XML sitemap.
+            state: State of the object, as returned by __getstate__().
+        """
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
+        self.__hash = None
 
     def __repr__(self: SitemapNewsStory) -> str:
         """Return string representation of the object."""
         return (
             f"{self.__class__.__name__}("
-            f"title={self.title}, "
-            f"publish_date={self.publish_date}, "
-            f"publication_name={self.publication_name}, "
-            f"publication_language={self.publication_language}, "
-            f"access={self.access}, "
-            f"genres={self.genres}, "
-            f"keywords={self.keywords}, "
-            f"stock_tickers={self.stock_tickers}"
+            f"title={self.__title}, "
+            f"publish_date={self.__publish_date}, "
+            f"publication_name={self.__publication_name}, "
+            f"publication_language={self.__publication_language}, "
+            f"access={self.__access}, "
+            f"genres={self.__genres}, "
+            f"keywords={self.__keywords}, "
+            f"stock_tickers={self.__stock_tickers}"
             ")"
         )
 
@@ -196,7 +224,7 @@ class SitemapNewsStory:
         return self.__access
 
     @property
-    def genres(self: SitemapNewsStory) -> list[str]:
+    def genres(self: SitemapNewsStory) -> tuple[str, ...]:
         """Return list of properties characterizing the content of the article.
 
         Args:
@@ -208,7 +236,7 @@ class SitemapNewsStory:
         return self.__genres
 
     @property
-    def keywords(self: SitemapNewsStory) -> list[str]:
+    def keywords(self: SitemapNewsStory) -> tuple[str, ...]:
         """Return list of keywords describing the topic of the article.
 
         Args:
@@ -220,7 +248,7 @@ class SitemapNewsStory:
         return self.__keywords
 
     @property
-    def stock_tickers(self: SitemapNewsStory) -> list[str]:
+    def stock_tickers(self: SitemapNewsStory) -> tuple[str, ...]:
         """Return list of up to 5 stock tickers that are the main subject of the article.
 
         Each ticker must be prefixed by the name of its stock exchange, and must match
@@ -251,7 +279,8 @@ class SitemapPageChangeFrequency(Enum):
     @classmethod
     def has_value(cls: type[SitemapPageChangeFrequency], value: str) -> bool:
         """Test if enum has specified value."""
-        return any(value == item.value for item in cls)
+        # Enum keeps a dict of its members by value, so there's no need to go through them one by one
+        return value in cls._value2member_map_
 
 
 class SitemapPage:
@@ -294,36 +323,35 @@ class SitemapPage:
             self: Single sitemap-derived page.
             other: Single sitemap-derived page.
 
-        Raises:
-            NotImplementedError: If other is not a SitemapPage.
-
         Returns:
-            True if sitemap pages are equal.
+            True if sitemap pages are equal, or NotImplemented if the other object is not a SitemapPage.
         """
-        if not isinstance(other, SitemapPage):
-            raise NotImplementedError
-
-        if self.url != other.url:
-            return False
+        if self is other:
+            return True
 
-        if self.priority != other.priority:
-            return False
-
-        if self.last_modified != other.last_modified:
-            return False
-
-        if self.change_frequency != other.change_frequency:
-            return False
-
-        if self.news_story != other.news_story:
-            return False
+        if not isinstance(other, SitemapPage):
+            return NotImplemented
 
-        return True
+        # Compare all fields at once, which compares them one by one in C and stops at the first difference
+        return (
+            self.__url,
+            self.__priority,
+            self.__last_modified,
+            self.__change_frequency,
+            self.__news_story,
+        ) == (
+            other.__url,
+            other.__priority,
+            other.__last_modified,
+            other.__change_frequency,
+            other.__news_story,
+        )
 
     def __hash__(self: SitemapPage) -> int:
         """Return hash of the object."""
-        # Hash only the URL to be able to find unique pages later on
-        return hash(self.url)
+        # Hash only the URL to be able to find unique pages later on; read the slot directly instead of going through
+        # the property as strings cache their own hash, so looking up the URL is most of the work here
+        return hash(self.__url)
 
     def __repr__(self: SitemapPage) -> str:
         """Return string representation of the object.
@@ -336,11 +364,11 @@ class SitemapPage:
         """
         return (
             f"{self.__class__.__name__}("
-            f"url={self.url}, "
-            f"priority={self.priority}, "
-            f"last_modified={self.last_modified}, "
-            f"change_frequency={self.change_frequency}, "
-            f"news_story={self.news_story}"
+            f"url={self.__url}, "
+            f"priority={self.__priority}, "
+            f"last_modified={self.__last_modified}, "
+            f"change_frequency={self.__change_frequency}, "
+            f"news_story={self.__news_story}"
             ")"
         )
 
@@ -5,6 +5,7 @@ import abc
 import os
 import pickle
 import tempfile
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -35,16 +36,16 @@ class AbstractSitemap(metaclass=abc.ABCMeta):
             self: The first sitemap.
             other: The second sitemap.
 
-        Raises:
-            NotImplementedError: If the other object is not a sitemap.
-
         Returns:
-            True if two sitemaps are equal.
+            True if two sitemaps are equal, or NotImplemented if the other object is not an AbstractSitemap.
         """
+        if self is other:
+            return True
+
         if not isinstance(other, AbstractSitemap):
-            raise NotImplementedError
+            return NotImplemented
 
-        if self.url != other.url:
+        if self.__url != other.__url:
             return False
 
         return True
@@ -55,7 +56,7 @@ class AbstractSitemap(metaclass=abc.ABCMeta):
         Returns:
             Hash of the sitemap.
         """
-        return hash((self.url,))
+        return hash((self.__url,))
 
     def __repr__(self: AbstractSitemap) -> str:
         """Return string representation of the sitemap.
@@ -63,7 +64,7 @@ class AbstractSitemap(metaclass=abc.ABCMeta):
         Returns:
             String representation of the sitemap.
         """
-        return f"{self.__class__.__name__}(url={self.url})"
+        return f"{self.__class__.__name__}(url={self.__url})"
 
     @property
     def url(self: AbstractSitemap) -> str:
@@ -113,22 +114,16 @@ class InvalidSitemap(AbstractSitemap):  # noqa: PLW1641
             self: The first invalid sitemap.
             other: The second invalid sitemap.
 
-        Raises:
-            NotImplementedError: If the other object is not an invalid sitemap.
-
         Returns:
-            True if two invalid sitemaps are equal.
+            True if two invalid sitemaps are equal, or NotImplemented if the other object is not an InvalidSitemap.
         """
-        if not isinstance(other, InvalidSitemap):
-            raise NotImplementedError
-
-        if self.url != other.url:
-            return False
+        if self is other:
+            return True
 
-        if self.reason != other.reason:
-            return False
+        if not isinstance(other, InvalidSitemap):
+            return NotImplemented
 
-        return True
+        return (self.url, self.__reason) == (other.url, other.__reason)
 
     def __repr__(self: InvalidSitemap) -> str:
         """Return string representation of the invalid sitemap.
@@ -139,7 +134,7 @@ class InvalidSitemap(AbstractSitemap):  # noqa: PLW1641
         Returns:
             String representation of the invalid sitemap.
         """
-        return f"{self.__class__.__name__}(url={self.url}, reason={self.reason})"
+        return f"{self.__class__.__name__}(url={self.url}, reason={self.__reason})"
 
     @property
     def reason(self: InvalidSitemap) -> str:
@@ -168,8 +163,13 @@ class InvalidSitemap(AbstractSitemap):  # noqa: PLW1641
 class AbstractPagesSitemap(AbstractSitemap, metaclass=abc.ABCMeta):  # noqa: PLW1641
     """Abstract sitemap that contains URLs to pages."""
 
+    __PAGES_PER_PICKLE = 1000
+    """Number of pages to pickle together; pages are read back one batch at a time."""
+
     __slots__: list[str] = [
         "__pages_temp_file_path",
+        "__page_count",
+        "__weakref__",
     ]
 
     def __init__(
@@ -184,17 +184,17 @@ class AbstractPagesSitemap(AbstractSitemap, metaclass=abc.ABCMeta):  # noqa: PLW
         """
         super().__init__(url=url)
 
+        self.__page_count: int = len(pages)
+
         temp_file, self.__pages_temp_file_path = tempfile.mkstemp()
         with os.fdopen(temp_file, "wb") as tmp:
-            pickle.dump(pages, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+            # Separate pickles of a batch of pages each, so that pages can be read back without loading all of them
+            for start in range(0, len(pages), self.__PAGES_PER_PICKLE):
+                end: int = start + self.__PAGES_PER_PICKLE
+                pickle.dump(pages[start:end], tmp, protocol=pickle.HIGHEST_PROTOCOL)
 
-    def __del__(self: AbstractPagesSitemap) -> None:
-        """Delete temporary file with pages.
-
-        Args:
-            self: The pages sitemap.
-        """
-        Path.unlink(Path(self.__pages_temp_file_path))
+        # Delete the temporary file once the sitemap is garbage collected (or at interpreter exit)
+        weakref.finalize(self, Path(self.__pages_temp_file_path).unlink, missing_ok=True)
 
     def __eq__(self: AbstractPagesSitemap, other: AbstractSitemap) -> bool:
         """Return True if two pages sitemaps are equal.
@@ -203,14 +203,15 @@ class AbstractPagesSitemap(AbstractSitemap, metaclass=abc.ABCMeta):  # noqa: PLW
             self: The first pages sitemap.
             other: The second pages sitemap.
 
-        Raises:
-            NotImplementedError: If the other object is not a pages sitemap.
-
         Returns:
-            True if two pages sitemaps are equal.
+            True if two pages sitemaps are equal, or NotImplemented if the other object is not an AbstractPagesSitemap.
         """
+        # Comparing pages means unpickling both lists of them, so don't bother if it's the very same sitemap
+        if self is other:
+            return True
+
         if not isinstance(other, AbstractPagesSitemap):
-            raise NotImplementedError
+            return NotImplemented
 
         if self.url != other.url:
             return False
@@ -223,10 +224,13 @@ class AbstractPagesSitemap(AbstractSitemap, metaclass=abc.ABCMeta):  # noqa: PLW
     def __repr__(self: AbstractPagesSitemap) -> str:
         """Return string representation of the pages sitemap.
 
+        Only the number of pages is included as listing them would mean reading all of them from the temporary file
+        (and printing them) every time the sitemap gets logged.
+
         Returns:
             String representation of the pages sitemap.
         """
-        return f"{self.__class__.__name__}(url={self.url}, pages={self.pages})"
+        return f"{self.__class__.__name__}(url={self.url}, page_count={self.__page_count})"
 
     @property
     def pages(self: AbstractPagesSitemap) -> list[SitemapPage]:
@@ -238,36 +242,52 @@ class AbstractPagesSitemap(AbstractSitemap, metaclass=abc.ABCMeta):  # noqa: PLW
         Returns:
             List of pages found in a sitemap.
         """
-        with Path.open(Path(self.__pages_temp_file_path), "rb") as tmp:
-            return pickle.load(tmp)  # noqa: S301
+        return list(self.all_pages())
 
     def all_pages(self: AbstractPagesSitemap) -> Iterator[SitemapPage]:
         """Return iterator which yields all pages of this sitemap and linked sitemaps (if any).
 
+        Pages are read from the temporary file as they're iterated over, so only a batch of them is in memory at a
+        time.
+
         Args:
             self: The pages sitemap.
 
         Yields:
             Iterator which yields all pages of this sitemap and linked sitemaps (if any).
         """
-        yield from self.pages
+        with Path.open(Path(self.__pages_temp_file_path), "rb") as tmp:
+            while True:
+                try:
+                    pages: list[SitemapPage] = pickle.load(tmp)  # noqa: S301
+                except EOFError:
+                    return
+                yield from pages
 
 
 class PagesXMLSitemap(AbstractPagesSitemap):
     """XML sitemap that contains URLs to pages."""
 
+    __slots__: list[str] = []
+
 
 class PagesTextSitemap(AbstractPagesSitemap):
     """Plain text sitemap that contains URLs to pages."""
 
+    __slots__: list[str] = []
+
 
 class PagesRSSSitemap(AbstractPagesSitemap):
     """RSS 2.0 sitemap that contains URLs to pages."""
 
+    __slots__: list[str] = []
+
 
 class PagesAtomSitemap(AbstractPagesSitemap):
     """RSS 0.3 / 1.0 sitemap that contains URLs to pages."""
 
+    __slots__: list[str] = []
+
 
 class AbstractIndexSitemap(AbstractSitemap):  # noqa: PLW1641
     """Abstract sitemap with URLs to other sitemaps."""
@@ -298,22 +318,16 @@ class AbstractIndexSitemap(AbstractSitemap):  # noqa: PLW1641
             self: The first index sitemap.
             other: The second index sitemap.
 
-        Raises:
-            NotImplementedError: If the other object is not an index sitemap.
-
         Returns:
-            True if two index sitemaps are equal.
+            True if two index sitemaps are equal, or NotImplemented if the other object is not an AbstractIndexSitemap.
         """
-        if not isinstance(other, AbstractIndexSitemap):
-            raise NotImplementedError
+        if self is other:
+            return True
 
-        if self.url != other.url:
-            return False
-
-        if self.sub_sitemaps != other.sub_sitemaps:
-            return False
+        if not isinstance(other, AbstractIndexSitemap):
+            return NotImplemented
 
-        return True
+        return (self.url, self.__sub_sitemaps) == (other.url, other.__sub_sitemaps)
 
     def __repr__(self: AbstractIndexSitemap) -> str:
         """Return string representation of the index sitemap.
@@ -321,7 +335,7 @@ class AbstractIndexSitemap(AbstractSitemap):  # noqa: PLW1641
         Returns:
             String representation of the index sitemap.
         """
-        return f"{self.__class__.__name__}(" f"url={self.url}, " f"sub_sitemaps={self.sub_sitemaps}" ")"
+        return f"{self.__class__.__name__}(" f"url={self.url}, " f"sub_sitemaps={self.__sub_sitemaps}" ")"
 
     @property
     def sub_sitemaps(self: AbstractIndexSitemap) -> list[AbstractSitemap]:
@@ -336,17 +350,23 @@ class AbstractIndexSitemap(AbstractSitemap):  # noqa: PLW1641
 
         :return: Iterator which yields all pages of this sitemap and linked sitemaps (if any).
         """
-        for sub_sitemap in self.sub_sitemaps:
+        for sub_sitemap in self.__sub_sitemaps:
             yield from sub_sitemap.all_pages()
 
 
 class IndexWebsiteSitemap(AbstractIndexSitemap):
     """Website's root sitemaps, including robots.txt and extra ones."""
 
+    __slots__: list[str] = []
+
 
 class IndexXMLSitemap(AbstractIndexSitemap):
     """XML sitemap with URLs to other sitemaps."""
 
+    __slots__: list[str] = []
+
 
 class IndexRobotsTxtSitemap(AbstractIndexSitemap):
     """robots.txt sitemap with URLs to other sitemaps."""
+
+    __slots__: list[str] = []
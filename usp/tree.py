@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-from urllib.parse import ParseResult, urljoin, urlparse
+from typing import TYPE_CHECKING
 
 from loguru import logger as log
 
 from .exceptions import SitemapExceptionError
-from .fetch_parse import SitemapFetcher
-from .helpers import is_http_url
+from .fetch_parse import CrawlState, SitemapFetcher
+from .helpers import is_http_url, strip_url_to_homepage
 from .objects.sitemap import (
     AbstractSitemap,
     IndexRobotsTxtSitemap,
@@ -17,8 +17,12 @@ from .objects.sitemap import (
     InvalidSitemap,
 )
 
-# Paths which are not exposed in robots.txt but might still contain a sitemap.
-_UNPUBLISHED_SITEMAP_PATHS: set[str] = {
+if TYPE_CHECKING:
+    from httpx import Client
+
+# Paths which are not exposed in robots.txt but might still contain a sitemap, most commonly found ones first so that
+# they're fetched in the same, predictable order every time.
+_UNPUBLISHED_SITEMAP_PATHS: tuple[str, ...] = (
     "sitemap.xml",
     "sitemap.xml.gz",
     "sitemap_index.xml",
@@ -33,15 +37,15 @@ _UNPUBLISHED_SITEMAP_PATHS: set[str] = {
     "sitemap-news.xml",
     "sitemap_news.xml.gz",
     "sitemap-news.xml.gz",
-}
+)
 
 
-def sitemap_tree_for_homepage(homepage_url: str) -> AbstractSitemap:
+def sitemap_tree_for_homepage(homepage_url: str, web_client: Client | None = None) -> AbstractSitemap:
     """Using a homepage URL, fetch the tree of sitemaps and pages listed in them.
 
     Args:
         homepage_url: Homepage URL of a website to fetch the sitemap tree for, e.g. "http://www.example.com/".
-        web_client: Web client implementation to use for fetching sitemaps.
+        web_client: Web client to use for fetching sitemaps, defaults to a client shared by all fetchers.
 
     Raises:
         SitemapException: If the homepage URL is not a HTTP(s) URL.
@@ -53,35 +57,52 @@ def sitemap_tree_for_homepage(homepage_url: str) -> AbstractSitemap:
         msg: str = f"URL {homepage_url} is not a HTTP(s) URL."
         raise SitemapExceptionError(msg)
 
-    parse_result: ParseResult = urlparse(homepage_url)
-    stripped_homepage_url: str = parse_result.scheme + "://" + parse_result.netloc + "/"
+    stripped_homepage_url: str = strip_url_to_homepage(url=homepage_url)
     if homepage_url != stripped_homepage_url:
         log.warning(f"Assuming that the homepage of {homepage_url} is {stripped_homepage_url}")
         homepage_url = stripped_homepage_url
 
-    robots_txt_url: str = urljoin(homepage_url, "robots.txt")
+    # Homepage URL has been stripped to "scheme://host/" by now, so there's no need to parse it with urljoin()
+    robots_txt_url: str = f"{homepage_url}robots.txt"
 
     sitemaps = []
 
-    robots_txt_fetcher = SitemapFetcher(url=robots_txt_url, recursion_level=0)
+    # Fetches from the whole tree share state such as hosts that keep failing, but nothing is shared between trees
+    crawl_state = CrawlState()
+
+    robots_txt_fetcher = SitemapFetcher(
+        url=robots_txt_url,
+        recursion_level=0,
+        web_client=web_client,
+        crawl_state=crawl_state,
+    )
     robots_txt_sitemap: AbstractSitemap = robots_txt_fetcher.sitemap()
     sitemaps.append(robots_txt_sitemap)
 
-    sitemap_urls_found_in_robots_txt = set()
-    if isinstance(robots_txt_sitemap, IndexRobotsTxtSitemap):
-        for sub_sitemap in robots_txt_sitemap.sub_sitemaps:
-            sitemap_urls_found_in_robots_txt.add(sub_sitemap.url)
-
-    for unpublished_sitemap_path in _UNPUBLISHED_SITEMAP_PATHS:
-        unpublished_sitemap_url: str = homepage_url + unpublished_sitemap_path
-
-        # Don't refetch URLs already found in robots.txt
-        if unpublished_sitemap_url not in sitemap_urls_found_in_robots_txt:
-            unpublished_sitemap_fetcher = SitemapFetcher(url=unpublished_sitemap_url, recursion_level=0)
-            unpublished_sitemap: AbstractSitemap = unpublished_sitemap_fetcher.sitemap()
-
-            # Skip the ones that weren't found
-            if not isinstance(unpublished_sitemap, InvalidSitemap):
-                sitemaps.append(unpublished_sitemap)
+    sitemap_urls_found_in_robots_txt: set[str] = (
+        {sub_sitemap.url for sub_sitemap in robots_txt_sitemap.sub_sitemaps}
+        if isinstance(robots_txt_sitemap, IndexRobotsTxtSitemap)
+        else set()
+    )
+
+    # Don't refetch URLs already found in robots.txt
+    unpublished_sitemap_urls: list[str] = [
+        unpublished_sitemap_url
+        for unpublished_sitemap_path in _UNPUBLISHED_SITEMAP_PATHS
+        if (unpublished_sitemap_url := f"{homepage_url}{unpublished_sitemap_path}")
+        not in sitemap_urls_found_in_robots_txt
+    ]
+
+    # Skip the ones that weren't found
+    sitemaps.extend(
+        unpublished_sitemap
+        for unpublished_sitemap in SitemapFetcher.sitemaps(
+            urls=unpublished_sitemap_urls,
+            recursion_level=0,
+            web_client=web_client,
+            crawl_state=crawl_state,
+        )
+        if not isinstance(unpublished_sitemap, InvalidSitemap)
+    )
 
     return IndexWebsiteSitemap(url=homepage_url, sub_sitemaps=sitemaps)